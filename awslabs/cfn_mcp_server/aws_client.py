@@ -14,14 +14,19 @@
 
 import botocore.config
 import sys
+from functools import lru_cache
 from awslabs.cfn_mcp_server.errors import ClientError
 from boto3 import Session
 from os import environ
 
 
 session = Session(profile_name=environ.get('AWS_PROFILE'))
+# Cached clients are shared by concurrent tool calls, so allow more pooled
+# connections than botocore's default of 10
 session_config = botocore.config.Config(
     user_agent_extra='cfn-mcp-server/1.0.0',
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
 )
 
 
@@ -50,6 +55,12 @@ def get_aws_client(service_name, region_name=None):
         # Try to get region from boto3 session first, then fall back to environment variable
         region_name = session.region_name or environ.get('AWS_REGION', 'us-east-1')
 
+    return _cached_client(service_name, region_name)
+
+
+@lru_cache(maxsize=64)
+def _cached_client(service_name, region_name):
+    """Create a client once per service and resolved region; failures are not cached."""
     # Credential detection and client creation
     try:
         print(
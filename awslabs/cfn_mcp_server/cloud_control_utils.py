@@ -15,6 +15,17 @@
 from awslabs.cfn_mcp_server.errors import ClientError
 
 
+# Fields each JSON Patch operation needs beyond 'op', in the order they are checked
+_PATCH_OP_FIELDS = {
+    'add': ('path', 'value'),
+    'remove': ('path',),
+    'replace': ('path', 'value'),
+    'move': ('path', 'from'),
+    'copy': ('path', 'from'),
+    'test': ('path', 'value'),
+}
+
+
 def validate_patch(patch_document: list):
     """A best effort check that makes sure that the format of a patch document is valid before sending it to CloudControl."""
     for patch_op in patch_document:
@@ -22,18 +33,17 @@ def validate_patch(patch_document: list):
             raise ClientError('Each patch operation must be a dictionary')
         if 'op' not in patch_op:
             raise ClientError("Each patch operation must include an 'op' field")
-        if patch_op['op'] not in ['add', 'remove', 'replace', 'move', 'copy', 'test']:
+        op = patch_op['op']
+        fields = _PATCH_OP_FIELDS.get(op) if isinstance(op, str) else None
+        if fields is None:
             raise ClientError(
-                f"Operation '{patch_op['op']}' is not supported. Must be one of: add, remove, replace, move, copy, test"
+                f"Operation '{op}' is not supported. Must be one of: add, remove, replace, move, copy, test"
             )
-        if 'path' not in patch_op:
-            raise ClientError("Each patch operation must include a 'path' field")
-        # Value is required for add, replace, and test operations
-        if patch_op['op'] in ['add', 'replace', 'test'] and 'value' not in patch_op:
-            raise ClientError(f"The '{patch_op['op']}' operation requires a 'value' field")
-        # From is required for move and copy operations
-        if patch_op['op'] in ['move', 'copy'] and 'from' not in patch_op:
-            raise ClientError(f"The '{patch_op['op']}' operation requires a 'from' field")
+        for field in fields:
+            if field not in patch_op:
+                if field == 'path':
+                    raise ClientError("Each patch operation must include a 'path' field")
+                raise ClientError(f"The '{op}' operation requires a '{field}' field")
 
 
 def progress_event(response_event, hooks_events) -> dict[str, str]:
@@ -9,7 +9,8 @@ import re
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Set, Tuple
 from functools import lru_cache
 
 # Optional imports
@@ -251,6 +252,11 @@ class DocumentationKnowledgeBase:
         Returns:
             List of best practices
         """
+        return [dict(practice) for practice in self._cached_best_practices(resource_type, topic)]
+    
+    @lru_cache(maxsize=256)
+    def _cached_best_practices(self, resource_type: Optional[str], topic: Optional[str]) -> Tuple[Mapping[str, str], ...]:
+        """Best practices for a resource type and topic, cached as read-only mappings."""
         query = "best practices"
         if resource_type:
             query += f" {resource_type}"
@@ -269,7 +275,8 @@ class DocumentationKnowledgeBase:
                 practices = self._extract_best_practices(content, resource_type)
                 best_practices.extend(practices)
         
-        return best_practices[:10]  # Limit to top 10 best practices
+        # Limit to top 10 best practices
+        return tuple(MappingProxyType(practice) for practice in best_practices[:10])
     
     def _extract_best_practices(self, content: str, resource_type: Optional[str] = None) -> List[Dict[str, str]]:
         """Extract best practices from content.
@@ -324,6 +331,11 @@ class DocumentationKnowledgeBase:
         Returns:
             List of troubleshooting steps
         """
+        return [dict(step) for step in self._cached_troubleshooting_guidance(error_message)]
+    
+    @lru_cache(maxsize=256)
+    def _cached_troubleshooting_guidance(self, error_message: str) -> Tuple[Mapping[str, str], ...]:
+        """Troubleshooting steps for an error message, cached as read-only mappings."""
         # Extract key terms from error message
         error_terms = set(re.findall(r'\b\w+\b', error_message.lower()))
         error_terms = {term for term in error_terms if len(term) > 3}  # Filter out short terms
@@ -353,7 +365,8 @@ class DocumentationKnowledgeBase:
                         "doc_id": doc_id
                     })
         
-        return guidance[:7]  # Limit to top 7 troubleshooting steps
+        # Limit to top 7 troubleshooting steps
+        return tuple(MappingProxyType(step) for step in guidance[:7])
     
     def _extract_troubleshooting_steps(self, content: str, error_terms: Set[str]) -> List[str]:
         """Extract troubleshooting steps from content.
@@ -620,6 +633,7 @@ def get_knowledge_base() -> DocumentationKnowledgeBase:
         return _knowledge_base
     except Exception as e:
         logger.error(f"Error creating knowledge base: {e}")
-        # Return a minimal knowledge base that won't crash the server
-        return DocumentationKnowledgeBase(docs_path="/tmp")
+        # Keep a minimal knowledge base that won't crash the server
+        _knowledge_base = DocumentationKnowledgeBase(docs_path="/tmp")
+        return _knowledge_base
 
@@ -5,6 +5,13 @@ import json
 import yaml
 from typing import Any, Dict, List, Optional, Union
 from functools import wraps
+from awslabs.cfn_mcp_server.resource_mapping import ARCHITECTURE_PATTERNS, RESOURCE_MAPPING
+
+
+# Resource types this package maps or generates, accepted without the regex check
+_KNOWN_RESOURCE_TYPES = frozenset(RESOURCE_MAPPING.values()).union(
+    *(pattern["components"] + pattern["optional"] for pattern in ARCHITECTURE_PATTERNS.values())
+)
 
 
 class ValidationError(Exception):
@@ -39,6 +46,9 @@ class InputValidator:
         if not isinstance(resource_type, str):
             raise ValidationError("Resource type must be a string")
         
+        if resource_type in _KNOWN_RESOURCE_TYPES:
+            return resource_type
+        
         if len(resource_type) > 100:
             raise ValidationError("Resource type too long")
         
@@ -14,10 +14,12 @@
 
 """Intelligent CloudFormation template generation from natural language."""
 
-import json
-import yaml
 import re
-from typing import Dict, List, Any, Optional, Tuple
+import sys
+from statistics import mean
+from types import MappingProxyType
+from functools import cached_property
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Any, NamedTuple, Optional, Set, Tuple
 from awslabs.cfn_mcp_server.aws_client import get_aws_client
 
 # Import config_manager only when needed to avoid circular dependencies
@@ -29,6 +31,149 @@ from awslabs.cfn_mcp_server.architecture_templates import (
 )
 
 
+# Descriptions whose scan results each generator keeps, oldest dropped first
+_SCAN_CACHE_SIZE = 256
+
+# Keyword tables are built once at import and frozen; keywords are matched
+# against the lowercased description at word starts (see _keyword_pattern).
+
+# Requirement indicators
+_REQUIREMENT_INDICATORS = MappingProxyType({
+    'high_availability': frozenset({'high availability', 'ha', 'fault tolerant', 'resilient', 'redundant'}),
+    'auto_scaling': frozenset({'auto scaling', 'scale', 'elastic', 'variable load'}),
+    'high_performance': frozenset({'high performance', 'fast', 'low latency'}),
+    'basic_performance': frozenset({'basic', 'simple', 'minimal'}),
+    'encryption': frozenset({'secure', 'encrypt', 'private', 'confidential'}),
+    'vpc_isolation': frozenset({'private', 'isolated', 'vpc', 'internal'}),
+    'ssl_tls': frozenset({'https', 'ssl', 'tls', 'certificate'}),
+})
+
+# Requirement statements and the keywords that imply them, in reporting order
+_FUNCTIONAL_REQUIREMENTS = MappingProxyType({
+    'Serve web content to users': frozenset({'web', 'website'}),
+    'Provide API endpoints for data access': frozenset({'api'}),
+    'Store and retrieve application data': frozenset({'database', 'data'}),
+    'Authenticate and authorize users': frozenset({'auth', 'login'}),
+    'Handle file uploads and storage': frozenset({'upload', 'file'}),
+})
+_NON_FUNCTIONAL_REQUIREMENTS = MappingProxyType({
+    'Handle high traffic and scale automatically': frozenset({'scale', 'high traffic'}),
+    'Implement security best practices': frozenset({'secure', 'security'}),
+    'Provide fast response times': frozenset({'fast', 'performance'}),
+    'Maintain high availability': frozenset({'available', 'uptime'}),
+})
+_CONSTRAINTS = MappingProxyType({
+    'Cost optimization required': frozenset({'budget', 'cost'}),
+    'Specific region requirements': frozenset({'region'}),
+    'Compliance requirements must be met': frozenset({'compliance'}),
+})
+
+# Discovery questions asked for every description, then per resource family
+_BASE_DISCOVERY_QUESTIONS = (
+    "What is the expected scale and traffic volume for this application?",
+    "What are your availability and disaster recovery requirements?",
+    "Are there specific compliance requirements (HIPAA, PCI, SOX, GDPR)?",
+    "What is your preferred deployment model (single region, multi-region)?",
+    "What are your security requirements and constraints?",
+)
+_DATABASE_DISCOVERY_QUESTIONS = (
+    "What type of database workload (OLTP, OLAP, mixed)?",
+    "What are your backup and retention requirements?",
+    "Do you need read replicas or multi-master setup?",
+)
+_WEB_DISCOVERY_QUESTIONS = (
+    "What is the expected request rate and response time requirements?",
+    "Do you need CDN or edge caching?",
+    "What authentication and authorization mechanisms are required?",
+)
+_STORAGE_DISCOVERY_QUESTIONS = (
+    "What are your data retention and lifecycle requirements?",
+    "Do you need cross-region replication?",
+    "What are your data access patterns (frequent, infrequent, archive)?",
+)
+
+
+def _keyword_pattern(keyword: str) -> str:
+    """Regex for a keyword that must start a word.
+
+    Longer keywords still match as word prefixes so stems such as 'encrypt'
+    or 'auth' cover 'encryption' and 'authentication'. Abbreviations of
+    three characters or fewer ('ha', 'api', 'spa') must be whole words,
+    optionally plural, so they do not fire inside 'what', 'rapid' or 'space'.
+    """
+    pattern = rf'\b{re.escape(keyword)}'
+    if len(keyword) <= 3:
+        pattern += r's?\b'
+    return pattern
+
+
+class _KeywordScanner:
+    """Detect which keyword groups occur in a text with a single regex pass.
+
+    Works like an Aho-Corasick automaton built on the stdlib ``re`` module:
+    all keywords form one longest-first alternation inside a lookahead, so
+    every word start is tested and the longest keyword matching there is
+    reported. Shorter keywords that also match at that position are its
+    prefixes, so their labels are folded into its label set up front.
+    """
+
+    def __init__(self, groups: Dict[Hashable, Iterable[str]]):
+        """Build the scanner from a mapping of label to keywords."""
+        labels_by_keyword: Dict[str, set] = {}
+        for label, keywords in groups.items():
+            for keyword in keywords:
+                labels_by_keyword.setdefault(keyword, set()).add(label)
+
+        keywords = sorted(labels_by_keyword, key=len, reverse=True)
+        patterns = [_keyword_pattern(keyword) for keyword in keywords]
+        self._labels = [
+            frozenset().union(
+                *(
+                    labels_by_keyword[prefix]
+                    for prefix, prefix_pattern in zip(keywords, patterns)
+                    if re.match(prefix_pattern, keyword)
+                )
+            )
+            for keyword in keywords
+        ]
+        alternation = '|'.join(f'({pattern})' for pattern in patterns)
+        self._regex = re.compile(f'(?=(?:{alternation}))')
+
+    def scan(self, text: str) -> Set[Hashable]:
+        """Return the labels of every keyword group found in ``text``."""
+        hits = set()
+        for match in self._regex.finditer(text):
+            hits |= self._labels[match.lastindex - 1]
+        return hits
+
+
+class ScaleRequirements(NamedTuple):
+    """Scale and performance requirements inferred from a description."""
+
+    high_availability: bool = False
+    auto_scaling: bool = False
+    multi_az: bool = False
+    performance_tier: str = 'standard'
+
+
+class SecurityRequirements(NamedTuple):
+    """Security requirements inferred from a description."""
+
+    encryption: bool = False
+    vpc_isolation: bool = False
+    iam_roles: bool = True  # Always recommended
+    security_groups: bool = True  # Always recommended
+    ssl_tls: bool = False
+
+
+# Architecture patterns with a dedicated multi-resource template generator
+_ARCHITECTURE_GENERATORS = {
+    'web_application': generate_web_application_architecture,
+    'serverless_api': generate_serverless_api_architecture,
+    'data_pipeline': generate_data_pipeline_architecture,
+}
+
+
 class IntelligentTemplateGenerator:
     """Generates comprehensive CloudFormation templates from natural language descriptions."""
     
@@ -41,7 +186,6 @@ class IntelligentTemplateGenerator:
         """
         self.config = config or config_manager
         self.region = region or self.config.get_config('aws.default_region')
-        self.client = get_aws_client('cloudformation', self.region)
         
         # Comprehensive resource patterns with context awareness
         self.resource_patterns = {
@@ -168,6 +312,45 @@ class IntelligentTemplateGenerator:
             }
         }
         
+        # AWS type names flow into analyses and generator dicts as keys and values;
+        # intern them so repeated hashing and comparisons hit the same objects
+        for category_info in self.resource_patterns.values():
+            category_info['resources'] = {
+                resource_key: sys.intern(resource_type)
+                for resource_key, resource_type in category_info['resources'].items()
+            }
+        
+        # Resource key -> AWS type across all categories, for O(1) component lookups
+        self._component_to_type = {
+            resource_key: resource_type
+            for category_info in self.resource_patterns.values()
+            for resource_key, resource_type in category_info['resources'].items()
+        }
+        
+        # Compiled views of resource_patterns, which stays the readable source
+        # of truth. Each category's resource keys and patterns form one
+        # alternation with one capture group per branch, wrapped in a lookahead
+        # so every position is tested and overlapping hits are kept. Categories
+        # are scanned separately because a lookahead only reports the first
+        # branch matching at a position, and two categories can share one
+        # ('key-value' is both a database and a security hint). The parallel
+        # tuple maps a group's index back to its resource key, or None for
+        # category patterns. Category patterns must only use non-capturing groups.
+        self._category_matchers = []
+        for category, category_info in self.resource_patterns.items():
+            resources = tuple(category_info['resources'].items())
+            branches = [rf'(\b{resource_key}\b)' for resource_key, _ in resources]
+            branches.extend(f'({pattern})' for pattern in category_info['patterns'])
+            group_resource_keys = (
+                *(resource_key for resource_key, _ in resources),
+                *(None for _ in category_info['patterns']),
+            )
+            self._category_matchers.append((
+                re.compile(f"(?=(?:{'|'.join(branches)}))"),
+                group_resource_keys,
+                resources,
+            ))
+        
         # Architecture patterns for intelligent resource relationships
         self.architecture_patterns = {
             'web_application': {
@@ -191,16 +374,55 @@ class IntelligentTemplateGenerator:
                 'components': ['s3', 'cloudfront', 'route53', 'certificate']
             }
         }
+        
+        # Architecture patterns in the order they are tried: patterns described by
+        # longer, more specific phrases first, so 'static website' is not claimed
+        # by web_application's 'website' and 'analytics api' is not claimed by
+        # serverless_api's bare 'api'.
+        self._architecture_priority = tuple(sorted(
+            self.architecture_patterns,
+            key=lambda name: mean(map(len, self.architecture_patterns[name]['keywords'])),
+            reverse=True,
+        ))
+        
+        # Every keyword this generator looks for, found in one pass. Architecture
+        # keywords are labelled with their pattern name; requirement keywords
+        # with the module-level labels above.
+        self._keyword_scanner = _KeywordScanner({
+            **{
+                ('architecture', pattern_name): pattern_info['keywords']
+                for pattern_name, pattern_info in self.architecture_patterns.items()
+            },
+            **_REQUIREMENT_INDICATORS,
+            **_FUNCTIONAL_REQUIREMENTS,
+            **_NON_FUNCTIONAL_REQUIREMENTS,
+            **_CONSTRAINTS,
+        })
+        
+        # Scan results per lowercased description. The scan depends on this
+        # instance's tables, so the memo lives on the instance and is released
+        # with it.
+        self._scan_cache: Dict[str, Tuple[FrozenSet[Hashable], Tuple[Tuple[str, str], ...]]] = {}
     
+    @cached_property
+    def client(self):
+        """CloudFormation client, created on first use.
+
+        Description analysis and template generation never talk to AWS, so the
+        boto3 client is only built when a caller actually needs it.
+        """
+        return get_aws_client('cloudformation', self.region)
+
     def analyze_description(self, description: str) -> Dict[str, Any]:
         """Analyze description to identify required AWS resources and architecture patterns."""
         description_lower = description.lower()
+        keyword_hits, named_resources = self._scan_description(description_lower)
         
         # Identify architecture pattern
-        architecture = self._identify_architecture_pattern(description_lower)
+        architecture = self._identify_architecture_pattern(keyword_hits)
         
         # Identify individual resources
-        identified_resources = self._identify_resources(description_lower)
+        identified_resources = dict(named_resources)
         
         # Enhance with architecture-specific resources
         if architecture:
@@ -208,43 +430,65 @@ class IntelligentTemplateGenerator:
             identified_resources.update(arch_resources)
         
         # Analyze scale and performance requirements
-        scale_requirements = self._analyze_scale_requirements(description_lower)
+        scale_requirements = self._analyze_scale_requirements(keyword_hits)
         
         # Identify security requirements
-        security_requirements = self._analyze_security_requirements(description_lower)
+        security_requirements = self._analyze_security_requirements(keyword_hits)
         
         return {
             'architecture_pattern': architecture,
             'resources': identified_resources,
-            'scale_requirements': scale_requirements,
-            'security_requirements': security_requirements,
+            'scale_requirements': scale_requirements._asdict(),
+            'security_requirements': security_requirements._asdict(),
             'original_description': description
         }
     
-    def _identify_architecture_pattern(self, description: str) -> Optional[str]:
-        """Identify the overall architecture pattern from description."""
-        for pattern_name, pattern_info in self.architecture_patterns.items():
-            for keyword in pattern_info['keywords']:
-                if keyword in description:
-                    return pattern_name
+    def _scan_description(
+        self, description: str
+    ) -> Tuple[FrozenSet[Hashable], Tuple[Tuple[str, str], ...]]:
+        """Scan a lowercased description for keyword hits and named resources.
+        
+        Both results depend only on the text, and discovery scans the same
+        description for analysis and again for requirements, so they are cached
+        as immutable values that callers copy before modifying.
+        """
+        cache = self._scan_cache
+        result = cache.get(description)
+        if result is None:
+            keyword_hits = frozenset(self._keyword_scanner.scan(description))
+            result = keyword_hits, tuple(self._identify_resources(description).items())
+            if len(cache) >= _SCAN_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[description] = result
+        return result
+    
+    def _identify_architecture_pattern(self, keyword_hits: Set[Hashable]) -> Optional[str]:
+        """Identify the overall architecture pattern from the description's keyword hits."""
+        for pattern_name in self._architecture_priority:
+            if ('architecture', pattern_name) in keyword_hits:
+                return pattern_name
         return None
     
     def _identify_resources(self, description: str) -> Dict[str, str]:
         """Identify individual AWS resources from description."""
         identified = {}
         
-        for category, category_info in self.resource_patterns.items():
-            for pattern in category_info['patterns']:
-                if re.search(pattern, description):
-                    # Find the most specific resource type
-                    for resource_key, resource_type in category_info['resources'].items():
-                        if re.search(rf'\b{resource_key}\b', description):
-                            identified[resource_key] = resource_type
-                            break
-                    else:
-                        # Use the first resource type as default for the category
-                        first_resource = list(category_info['resources'].items())[0]
-                        identified[first_resource[0]] = first_resource[1]
+        for matcher, group_resource_keys, category_resources in self._category_matchers:
+            matched_keys = {
+                group_resource_keys[match.lastindex - 1] for match in matcher.finditer(description)
+            }
+            if not matched_keys:
+                continue
+            
+            # Prefer the most specific resource named in the description
+            for resource_key, resource_type in category_resources:
+                if resource_key in matched_keys:
+                    identified[resource_key] = resource_type
+                    break
+            else:
+                # Use the first resource type as default for the category
+                resource_key, resource_type = category_resources[0]
+                identified[resource_key] = resource_type
         
         return identified
     
@@ -253,69 +497,40 @@ class IntelligentTemplateGenerator:
         if architecture not in self.architecture_patterns:
             return {}
         
-        components = self.architecture_patterns[architecture]['components']
-        resources = {}
-        
-        for component in components:
-            # Find the resource type for this component
-            for category_info in self.resource_patterns.values():
-                if component in category_info['resources']:
-                    resources[component] = category_info['resources'][component]
-                    break
-        
-        return resources
+        return {
+            component: self._component_to_type[component]
+            for component in self.architecture_patterns[architecture]['components']
+            if component in self._component_to_type
+        }
     
-    def _analyze_scale_requirements(self, description: str) -> Dict[str, Any]:
+    def _analyze_scale_requirements(self, keyword_hits: Set[Hashable]) -> ScaleRequirements:
         """Analyze scale and performance requirements."""
-        requirements = {
-            'high_availability': False,
-            'auto_scaling': False,
-            'multi_az': False,
-            'performance_tier': 'standard'
-        }
-        
         # High availability indicators
-        ha_keywords = ['high availability', 'ha', 'fault tolerant', 'resilient', 'redundant']
-        if any(keyword in description for keyword in ha_keywords):
-            requirements['high_availability'] = True
-            requirements['multi_az'] = True
-        
-        # Auto scaling indicators
-        scaling_keywords = ['auto scaling', 'scale', 'elastic', 'variable load']
-        if any(keyword in description for keyword in scaling_keywords):
-            requirements['auto_scaling'] = True
+        high_availability = 'high_availability' in keyword_hits
         
         # Performance indicators
-        if any(keyword in description for keyword in ['high performance', 'fast', 'low latency']):
-            requirements['performance_tier'] = 'high'
-        elif any(keyword in description for keyword in ['basic', 'simple', 'minimal']):
-            requirements['performance_tier'] = 'basic'
-        
-        return requirements
+        if 'high_performance' in keyword_hits:
+            performance_tier = 'high'
+        elif 'basic_performance' in keyword_hits:
+            performance_tier = 'basic'
+        else:
+            performance_tier = 'standard'
+        
+        return ScaleRequirements(
+            high_availability=high_availability,
+            auto_scaling='auto_scaling' in keyword_hits,
+            multi_az=high_availability,
+            performance_tier=performance_tier,
+        )
     
-    def _analyze_security_requirements(self, description: str) -> Dict[str, Any]:
+    def _analyze_security_requirements(self, keyword_hits: Set[Hashable]) -> SecurityRequirements:
         """Analyze security requirements."""
-        requirements = {
-            'encryption': False,
-            'vpc_isolation': False,
-            'iam_roles': True,  # Always recommended
-            'security_groups': True,  # Always recommended
-            'ssl_tls': False
-        }
-        
-        # Encryption indicators
-        if any(keyword in description for keyword in ['secure', 'encrypt', 'private', 'confidential']):
-            requirements['encryption'] = True
-        
-        # VPC isolation indicators
-        if any(keyword in description for keyword in ['private', 'isolated', 'vpc', 'internal']):
-            requirements['vpc_isolation'] = True
-        
-        # SSL/TLS indicators
-        if any(keyword in description for keyword in ['https', 'ssl', 'tls', 'certificate']):
-            requirements['ssl_tls'] = True
-        
-        return requirements
+        return SecurityRequirements(
+            encryption='encryption' in keyword_hits,
+            vpc_isolation='vpc_isolation' in keyword_hits,
+            ssl_tls='ssl_tls' in keyword_hits,
+        )
+
     def generate_architecture_template(self, analysis: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """Generate a comprehensive template based on the identified architecture pattern.
         
@@ -325,19 +540,19 @@ class IntelligentTemplateGenerator:
         Returns:
             Dictionary of CloudFormation resources
         """
-        architecture = analysis.get('architecture_pattern')
-        
-        if architecture == 'web_application':
-            return generate_web_application_architecture(analysis, self.config)
-        elif architecture == 'serverless_api':
-            return generate_serverless_api_architecture(analysis, self.config)
-        elif architecture == 'data_pipeline':
-            return generate_data_pipeline_architecture(analysis, self.config)
-        else:
-            # If no specific architecture is identified, use the resource generator
-            from awslabs.cfn_mcp_server.resource_generator import ResourceGenerator
-            resource_gen = ResourceGenerator(self.config)
-            return resource_gen.generate_resources(analysis)
+        generator = _ARCHITECTURE_GENERATORS.get(analysis.get('architecture_pattern'))
+        if generator:
+            return generator(analysis, self.config)
+
+        # If no specific architecture is identified, use the resource generator
+        return self._resource_generator.generate_resources(analysis)
+
+    @cached_property
+    def _resource_generator(self):
+        """Per-resource fallback generator, created on first use."""
+        from awslabs.cfn_mcp_server.resource_generator import ResourceGenerator
+        return ResourceGenerator(self.config)
+
     def create_discovery_prompt(self, description: str) -> Dict[str, Any]:
         """
         Create a discovery prompt for template generation.
@@ -385,40 +600,20 @@ class IntelligentTemplateGenerator:
 
     def _generate_discovery_questions(self, analysis: Dict[str, Any]) -> List[str]:
         """Generate discovery questions based on initial analysis."""
-        questions = []
-        
-        # Base questions
-        questions.extend([
-            "What is the expected scale and traffic volume for this application?",
-            "What are your availability and disaster recovery requirements?",
-            "Are there specific compliance requirements (HIPAA, PCI, SOX, GDPR)?",
-            "What is your preferred deployment model (single region, multi-region)?",
-            "What are your security requirements and constraints?"
-        ])
-        
-        # Resource-specific questions
-        resources = analysis.get('resources', [])
+        questions = list(_BASE_DISCOVERY_QUESTIONS)
+        
+        # Resource-specific questions, matched against keys and types lowercased once
+        resources = analysis.get('resources', {})
+        resources_blob = ' '.join(f'{key} {value}' for key, value in resources.items()).lower()
         
-        if 'database' in str(resources).lower():
-            questions.extend([
-                "What type of database workload (OLTP, OLAP, mixed)?",
-                "What are your backup and retention requirements?",
-                "Do you need read replicas or multi-master setup?"
-            ])
-        
-        if 'web' in str(resources).lower() or 'api' in str(resources).lower():
-            questions.extend([
-                "What is the expected request rate and response time requirements?",
-                "Do you need CDN or edge caching?",
-                "What authentication and authorization mechanisms are required?"
-            ])
-        
-        if 'storage' in str(resources).lower():
-            questions.extend([
-                "What are your data retention and lifecycle requirements?",
-                "Do you need cross-region replication?",
-                "What are your data access patterns (frequent, infrequent, archive)?"
-            ])
+        if 'database' in resources_blob:
+            questions += _DATABASE_DISCOVERY_QUESTIONS
+        
+        if 'web' in resources_blob or 'api' in resources_blob:
+            questions += _WEB_DISCOVERY_QUESTIONS
+        
+        if 'storage' in resources_blob:
+            questions += _STORAGE_DISCOVERY_QUESTIONS
         
         return questions[:10]  # Limit to 10 questions
 
@@ -429,7 +624,7 @@ class IntelligentTemplateGenerator:
         architecture_pattern = analysis.get('architecture_pattern', '')
         resources = analysis.get('resources', [])
         
-        if architecture_pattern == 'web-application':
+        if architecture_pattern == 'web_application':
             patterns.append({
                 'name': '3-Tier Web Application',
                 'description': 'Classic web application with presentation, application, and data tiers',
@@ -453,7 +648,7 @@ class IntelligentTemplateGenerator:
                 'components': 'API Gateway + Lambda + EventBridge + DynamoDB'
             })
         
-        elif architecture_pattern == 'data-processing':
+        elif architecture_pattern == 'data_pipeline':
             patterns.append({
                 'name': 'Batch Processing Pipeline',
                 'description': 'Scheduled batch processing with data lake',
@@ -477,69 +672,27 @@ class IntelligentTemplateGenerator:
 
     def _analyze_requirements(self, description: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze requirements from description and initial analysis."""
+        keyword_hits, _ = self._scan_description(description.lower())
         return {
-            'functional_requirements': self._extract_functional_requirements(description),
-            'non_functional_requirements': self._extract_non_functional_requirements(description),
-            'constraints': self._identify_constraints(description),
+            'functional_requirements': self._extract_functional_requirements(keyword_hits),
+            'non_functional_requirements': self._extract_non_functional_requirements(keyword_hits),
+            'constraints': self._identify_constraints(keyword_hits),
             'assumptions': self._identify_assumptions(analysis)
         }
 
-    def _extract_functional_requirements(self, description: str) -> List[str]:
-        """Extract functional requirements from description."""
-        requirements = []
-        desc_lower = description.lower()
-        
-        if 'web' in desc_lower or 'website' in desc_lower:
-            requirements.append("Serve web content to users")
-        
-        if 'api' in desc_lower:
-            requirements.append("Provide API endpoints for data access")
-        
-        if 'database' in desc_lower or 'data' in desc_lower:
-            requirements.append("Store and retrieve application data")
-        
-        if 'auth' in desc_lower or 'login' in desc_lower:
-            requirements.append("Authenticate and authorize users")
-        
-        if 'upload' in desc_lower or 'file' in desc_lower:
-            requirements.append("Handle file uploads and storage")
-        
-        return requirements
+    def _extract_functional_requirements(self, keyword_hits: Set[Hashable]) -> List[str]:
+        """Extract functional requirements from the description's keyword hits."""
+        return [requirement for requirement in _FUNCTIONAL_REQUIREMENTS if requirement in keyword_hits]
 
-    def _extract_non_functional_requirements(self, description: str) -> List[str]:
-        """Extract non-functional requirements from description."""
-        requirements = []
-        desc_lower = description.lower()
-        
-        if 'scale' in desc_lower or 'high traffic' in desc_lower:
-            requirements.append("Handle high traffic and scale automatically")
-        
-        if 'secure' in desc_lower or 'security' in desc_lower:
-            requirements.append("Implement security best practices")
-        
-        if 'fast' in desc_lower or 'performance' in desc_lower:
-            requirements.append("Provide fast response times")
-        
-        if 'available' in desc_lower or 'uptime' in desc_lower:
-            requirements.append("Maintain high availability")
-        
-        return requirements
+    def _extract_non_functional_requirements(self, keyword_hits: Set[Hashable]) -> List[str]:
+        """Extract non-functional requirements from the description's keyword hits."""
+        return [
+            requirement for requirement in _NON_FUNCTIONAL_REQUIREMENTS if requirement in keyword_hits
+        ]
 
-    def _identify_constraints(self, description: str) -> List[str]:
-        """Identify constraints from description."""
-        constraints = []
-        desc_lower = description.lower()
-        
-        if 'budget' in desc_lower or 'cost' in desc_lower:
-            constraints.append("Cost optimization required")
-        
-        if 'region' in desc_lower:
-            constraints.append("Specific region requirements")
-        
-        if 'compliance' in desc_lower:
-            constraints.append("Compliance requirements must be met")
-        
-        return constraints
+    def _identify_constraints(self, keyword_hits: Set[Hashable]) -> List[str]:
+        """Identify constraints from the description's keyword hits."""
+        return [constraint for constraint in _CONSTRAINTS if constraint in keyword_hits]
 
     def _identify_assumptions(self, analysis: Dict[str, Any]) -> List[str]:
         """Identify assumptions based on analysis."""
@@ -549,7 +702,7 @@ class IntelligentTemplateGenerator:
             "Network connectivity requirements will be met"
         ]
         
-        if analysis.get('architecture_pattern') == 'web-application':
+        if analysis.get('architecture_pattern') == 'web_application':
             assumptions.append("Internet-facing application with public access")
         
         return assumptions
@@ -557,6 +710,11 @@ class IntelligentTemplateGenerator:
     def _create_expert_discovery_prompt(self, description: str, analysis: Dict[str, Any], 
                                       questions: List[str], patterns: List[Dict[str, str]]) -> str:
         """Create expert discovery prompt for Claude."""
+        questions_block = '\n'.join(f'{i + 1}. {q}' for i, q in enumerate(questions))
+        patterns_block = '\n'.join(
+            f"### {p['name']}\n{p['description']}\n**Components**: {p['components']}\n"
+            for p in patterns
+        )
         return f"""
 # CloudFormation Template Generation - Discovery Phase
 
@@ -573,13 +731,13 @@ class IntelligentTemplateGenerator:
 
 To create the most appropriate CloudFormation template, I need to understand your requirements better. Please answer the following questions:
 
-{chr(10).join([f"{i+1}. {q}" for i, q in enumerate(questions)])}
+{questions_block}
 
 ## Suggested Architecture Patterns
 
 Based on your description, here are some architecture patterns to consider:
 
-{chr(10).join([f"### {p['name']}{chr(10)}{p['description']}{chr(10)}**Components**: {p['components']}{chr(10)}" for p in patterns])}
+{patterns_block}
 
 ## Next Steps
 
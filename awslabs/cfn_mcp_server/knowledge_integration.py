@@ -1,14 +1,45 @@
 """Integration of CloudFormation documentation knowledge with MCP server tools."""
 
-import json
-import yaml
+import os
 import logging
-from typing import Dict, List, Any, Optional, Callable
-from functools import wraps
-from awslabs.cfn_mcp_server.documentation_knowledge_base import get_knowledge_base
+from typing import Dict, List, Any, Optional, Callable, Iterable, Iterator
+from functools import lru_cache, wraps
+from itertools import chain, islice
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_MAX_SUGGESTIONS = 200
+
+def _max_suggestions_from_env() -> int:
+    """Read CFN_MCP_MAX_SUGGESTIONS, falling back to the default when it is not an integer."""
+    value = os.environ.get("CFN_MCP_MAX_SUGGESTIONS")
+    if value is None:
+        return _DEFAULT_MAX_SUGGESTIONS
+    try:
+        return max(0, int(value))
+    except ValueError:
+        logger.warning(
+            f"Invalid CFN_MCP_MAX_SUGGESTIONS value {value!r}, using {_DEFAULT_MAX_SUGGESTIONS}"
+        )
+        return _DEFAULT_MAX_SUGGESTIONS
+
+# Upper bound on suggestions added to a single template response
+MAX_SUGGESTIONS = _max_suggestions_from_env()
+
+# PyYAML and the knowledge base are imported on first use, so importing this
+# module stays cheap for tools that never reach enhancement.
+
+@lru_cache(maxsize=1)
+def _knowledge_base():
+    """Return the shared documentation knowledge base."""
+    from awslabs.cfn_mcp_server.documentation_knowledge_base import get_knowledge_base
+    return get_knowledge_base()
+
+def _load_yaml(content: str) -> Any:
+    """Parse YAML with the libyaml-backed loader when PyYAML was built with it."""
+    import yaml
+    return yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
 def enhance_with_knowledge(func: Callable) -> Callable:
     """Decorator to enhance MCP tool responses with documentation knowledge.
     
@@ -20,48 +51,49 @@ def enhance_with_knowledge(func: Callable) -> Callable:
     """
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        # Execute original function
-        try:
-            response = await func(*args, **kwargs)
-        except Exception as e:
-            logger.error(f"Error in original function: {e}")
-            # Re-raise the exception to maintain original behavior
-            raise
+        # Errors from the original function propagate unchanged
+        response = await func(*args, **kwargs)
         
-        try:
-            # Only enhance successful responses
-            if isinstance(response, dict) and response.get("success", False):
-                try:
-                    # Get knowledge base
-                    kb = get_knowledge_base()
-                    
-                    # Determine the type of response and enhance accordingly
-                    if "template_content" in response or "template" in response:
-                        # Template generation response
-                        enhanced_response = enhance_template_response(response, kb)
-                        return enhanced_response
-                    elif "resource_type" in response:
-                        # Resource-related response
-                        enhanced_response = enhance_resource_response(response, kb)
-                        return enhanced_response
-                    elif "error" in response:
-                        # Error response
-                        enhanced_response = enhance_error_response(response, kb)
-                        return enhanced_response
-                except Exception as e:
-                    logger.error(f"Error in knowledge enhancement: {e}")
-                    # Fall through to return original response
-                
-            # Return original response if no enhancement applied
+        # Only enhance successful responses; tools return plain dicts, so check the exact type first
+        is_dict = type(response) is dict or isinstance(response, dict)
+        if not (is_dict and response.get("success", False)):
             return response
-            
+        
+        # Skip responses already enhanced by an inner decorated call or opted out
+        if (response.get("knowledge_source") == "CloudFormation Documentation"
+                or response.get("_skip_enhancement")):
+            return response
+        
+        try:
+            # Determine the type of response and enhance accordingly
+            for key, enhance in _RESPONSE_ENHANCERS:
+                if key in response:
+                    return enhance(response, _knowledge_base())
         except Exception as e:
             logger.error(f"Error enhancing response with knowledge: {e}")
-            # Return original response if enhancement fails
-            return response
+        
+        # Return original response if no enhancement applied
+        return response
             
     return wrapper
 
+def _unique_suggestions(suggestions: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Yield suggestions, skipping repeats of the same advice.
+    
+    Resources of the same type share their best practices, so only the first
+    resource of each type carries them.
+    """
+    seen = set()
+    for suggestion in suggestions:
+        key = (
+            suggestion["type"],
+            suggestion.get("resource_type"),
+            suggestion.get("suggestion", suggestion.get("doc_id"))
+        )
+        if key not in seen:
+            seen.add(key)
+            yield suggestion
+
 def enhance_template_response(response: Dict[str, Any], kb) -> Dict[str, Any]:
     """Enhance a template generation response with documentation knowledge.
     
@@ -75,8 +107,12 @@ def enhance_template_response(response: Dict[str, Any], kb) -> Dict[str, Any]:
     # Extract template from response
     template = None
     if "template_content" in response and response["format"] == "YAML":
+        # Diffs and parameter-only snippets have nothing to enhance; skip the parse
+        content = response["template_content"]
+        if isinstance(content, str) and "Resources" not in content:
+            return response
         try:
-            template = yaml.safe_load(response["template_content"])
+            template = _load_yaml(response["template_content"])
         except Exception as e:
             logger.error(f"Error parsing YAML template: {e}")
     elif "template" in response and response["format"] == "JSON":
@@ -86,50 +122,66 @@ def enhance_template_response(response: Dict[str, Any], kb) -> Dict[str, Any]:
         return response
     
     # Get template description or use empty string
-    description = template.get("Description", "") if isinstance(template, dict) else ""
+    template_is_dict = type(template) is dict or isinstance(template, dict)
+    description = template.get("Description", "") if template_is_dict else ""
     
     # Get best practices based on template content
-    suggestions = []
+    resource_suggestions = ()
     
     # Add best practices for resource types in the template
-    if isinstance(template, dict) and "Resources" in template:
-        for resource_id, resource in template["Resources"].items():
-            if isinstance(resource, dict) and "Type" in resource:
-                resource_type = resource["Type"]
-                
-                # Get best practices for this resource type
-                practices = kb.get_best_practices(resource_type)
-                for practice in practices:
-                    suggestion = {
-                        "type": "best_practice",
-                        "resource_type": resource_type,
-                        "resource_id": resource_id,
-                        "suggestion": practice["practice"],
-                        "source": "CloudFormation Documentation"
-                    }
-                    suggestions.append(suggestion)
+    resources = template.get("Resources") if template_is_dict else None
+    if resources and (type(resources) is dict or isinstance(resources, dict)):
+        typed_resources = [
+            (resource_id, resource["Type"])
+            for resource_id, resource in resources.items()
+            if (type(resource) is dict or isinstance(resource, dict)) and "Type" in resource
+        ]
+        
+        # Query each distinct resource type once, then fan out per resource
+        practices_by_type = {
+            resource_type: kb.get_best_practices(resource_type)
+            for resource_type in dict.fromkeys(resource_type for _, resource_type in typed_resources)
+        }
+        
+        resource_suggestions = (
+            {
+                "type": "best_practice",
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "suggestion": practice["practice"],
+                "source": "CloudFormation Documentation"
+            }
+            for resource_id, resource_type in typed_resources
+            for practice in practices_by_type[resource_type]
+        )
     
     # Add general template best practices
-    general_practices = kb.get_best_practices(topic="template")
-    for practice in general_practices:
-        suggestion = {
+    general_suggestions = (
+        {
             "type": "best_practice",
             "resource_type": "General",
             "suggestion": practice["practice"],
             "source": "CloudFormation Documentation"
         }
-        suggestions.append(suggestion)
+        for practice in kb.get_best_practices(topic="template")
+    )
     
     # Add documentation references
-    doc_results = kb.search_documentation(description, max_results=3)
-    for result in doc_results:
-        suggestion = {
+    documentation_suggestions = (
+        {
             "type": "documentation",
             "title": result["title"],
             "snippet": result["snippet"],
             "doc_id": result["doc_id"]
         }
-        suggestions.append(suggestion)
+        for result in kb.search_documentation(description, max_results=3)
+    )
+    
+    # Stop generating once the cap is reached
+    suggestions = list(islice(
+        _unique_suggestions(chain(resource_suggestions, general_suggestions, documentation_suggestions)),
+        MAX_SUGGESTIONS
+    ))
     
     # Add suggestions to response
     if "suggestions" in response and isinstance(response["suggestions"], list):
@@ -196,6 +248,14 @@ def enhance_error_response(response: Dict[str, Any], kb) -> Dict[str, Any]:
     
     return response
 
+# Response key that identifies each kind of response, checked in order
+_RESPONSE_ENHANCERS = (
+    ("template_content", enhance_template_response),
+    ("template", enhance_template_response),
+    ("resource_type", enhance_resource_response),
+    ("error", enhance_error_response),
+)
+
 def get_documentation_for_topic(topic: str, max_results: int = 5) -> List[Dict[str, Any]]:
     """Get documentation for a specific topic.
     
@@ -206,7 +266,7 @@ def get_documentation_for_topic(topic: str, max_results: int = 5) -> List[Dict[s
     Returns:
         List of documentation entries
     """
-    kb = get_knowledge_base()
+    kb = _knowledge_base()
     return kb.search_documentation(topic, max_results=max_results)
 
 def get_best_practices_for_resource(resource_type: str) -> List[Dict[str, str]]:
@@ -218,7 +278,7 @@ def get_best_practices_for_resource(resource_type: str) -> List[Dict[str, str]]:
     Returns:
         List of best practices
     """
-    kb = get_knowledge_base()
+    kb = _knowledge_base()
     return kb.get_best_practices(resource_type)
 
 def get_troubleshooting_for_error(error_message: str) -> List[Dict[str, str]]:
@@ -230,5 +290,5 @@ def get_troubleshooting_for_error(error_message: str) -> List[Dict[str, str]]:
     Returns:
         List of troubleshooting steps
     """
-    kb = get_knowledge_base()
+    kb = _knowledge_base()
     return kb.get_troubleshooting_guidance(error_message)
\ No newline at end of file
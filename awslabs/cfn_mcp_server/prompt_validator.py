@@ -2,6 +2,94 @@
 Prompt Quality Validation System for CloudFormation MCP
 """
 
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Union
+
+# Keyword groups scored by the individual checks. Matching is substring based,
+# so stems such as "configure" also count "configuration".
+_COMPLETENESS_INDICATORS = frozenset({
+    "parameters", "outputs", "resources", "security", "monitoring",
+    "backup", "scaling", "networking", "iam", "encryption"
+})
+
+_AWS_SERVICES = frozenset({
+    "ec2", "s3", "rds", "lambda", "api gateway", "cloudfront", "route53",
+    "alb", "elb", "vpc", "iam", "kms", "dynamodb", "kinesis", "sqs", "sns"
+})
+
+_CONFIG_INDICATORS = frozenset({
+    "instance type", "storage size", "memory", "cpu", "port", "protocol",
+    "cidr", "subnet", "availability zone", "region", "encryption key"
+})
+
+_PERFORMANCE_INDICATORS = frozenset({
+    "requests per second", "concurrent users", "latency", "throughput",
+    "storage capacity", "bandwidth", "iops", "connections"
+})
+
+_INSTRUCTION_INDICATORS = frozenset({
+    "step 1", "step 2", "first", "then", "next", "finally",
+    "create", "configure", "deploy", "validate", "test"
+})
+
+_CLI_INDICATORS = frozenset({"aws ", "cloudformation", "describe-", "create-", "update-", "delete-"})
+
+_EXAMPLE_INDICATORS = frozenset({"example", "template", "sample", "format:", "```"})
+
+_SCALE_INDICATORS = frozenset({"scale", "performance", "traffic", "load", "capacity"})
+
+# Aspects that cover implicit requirements; any keyword of an aspect covers it
+_IMPLICIT_ASPECTS = (
+    frozenset({"security"}),
+    frozenset({"performance"}),
+    frozenset({"operational", "monitoring"}),
+)
+
+# Every distinct keyword, looked up once per prompt and shared by all checks
+_ALL_INDICATORS = frozenset().union(
+    _COMPLETENESS_INDICATORS, _AWS_SERVICES, _CONFIG_INDICATORS, _PERFORMANCE_INDICATORS,
+    _INSTRUCTION_INDICATORS, _CLI_INDICATORS, _EXAMPLE_INDICATORS, _SCALE_INDICATORS,
+    *_IMPLICIT_ASPECTS
+)
+
+# Minimum overall score for each quality level, best first
+_QUALITY_THRESHOLDS = {
+    "EXCELLENT": 0.9,
+    "GOOD": 0.8,
+    "ACCEPTABLE": 0.7,
+    "NEEDS_IMPROVEMENT": 0.6,
+    "POOR": 0.0,
+}
+
+
+@dataclass(slots=True)
+class ValidationContext:
+    """Analysis context normalized once so many prompts can be scored against it.
+    
+    The *_lower fields are matched against the lowercased prompt; suggestions
+    quote the original values.
+    """
+    architecture_type: str = ""
+    compliance_requirements: Tuple[str, ...] = ()
+    architecture_type_lower: str = ""
+    compliance_requirements_lower: Tuple[str, ...] = ()
+    scale: str = ""
+    implicit_requirements: Optional[FrozenSet[str]] = None  # None when none were detected
+
+
+class ValidationResult(NamedTuple):
+    """Outcome of validate_prompt_quality; use to_dict() for JSON responses."""
+    overall_score: float
+    component_scores: Dict[str, float]
+    feedback: List[str]
+    quality_level: str
+    improvement_suggestions: List[str]
+    
+    def to_dict(self) -> dict:
+        """Return the result as a plain dict."""
+        return self._asdict()
+
+
 class PromptValidator:
     def __init__(self):
         self.validation_criteria = {
@@ -42,152 +130,164 @@ class PromptValidator:
                 "weight": 0.2
             }
         }
+        
+        # Bound once so scoring avoids the nested criteria lookups
+        self._completeness_weight = self.validation_criteria["completeness"]["weight"]
+        self._specificity_weight = self.validation_criteria["specificity"]["weight"]
+        self._actionability_weight = self.validation_criteria["actionability"]["weight"]
+        self._context_awareness_weight = self.validation_criteria["context_awareness"]["weight"]
+        self._required_sections = self.validation_criteria["completeness"]["required_sections"]
+        
+        # (name, weight, check, feedback threshold, feedback), heaviest first
+        checks = sorted(
+            [
+                ("completeness", self._completeness_weight, self._check_completeness, 0.8,
+                 "Prompt is missing key sections - add more comprehensive requirements"),
+                ("specificity", self._specificity_weight, self._check_specificity, 0.7,
+                 "Prompt needs more specific technical details and service configurations"),
+                ("actionability", self._actionability_weight, self._check_actionability, 0.7,
+                 "Prompt needs more actionable instructions and concrete examples"),
+                ("context_awareness", self._context_awareness_weight, self._check_context_awareness, 0.7,
+                 "Prompt should better incorporate user's specific context and requirements"),
+            ],
+            key=lambda check: check[1],
+            reverse=True
+        )
+        # Each check also carries the total weight of the checks after it
+        self._checks = [
+            (name, weight, sum(later[1] for later in checks[index + 1:]), check, threshold, message)
+            for index, (name, weight, check, threshold, message) in enumerate(checks)
+        ]
     
-    def validate_prompt_quality(self, prompt: str, context: dict) -> dict:
-        """Validate the quality of a generated prompt."""
+    def prepare_context(self, context: dict) -> ValidationContext:
+        """Normalize an analysis dict for repeated validate_prompt_quality calls."""
         
+        implicit_reqs = context.get("implicit_requirements", {})
+        architecture_type = context.get("architecture_type", "")
+        compliance_requirements = tuple(context.get("compliance_requirements", []))
+        return ValidationContext(
+            architecture_type=architecture_type,
+            compliance_requirements=compliance_requirements,
+            architecture_type_lower=architecture_type.lower(),
+            compliance_requirements_lower=tuple(req.lower() for req in compliance_requirements),
+            scale=context.get("scale", "").lower(),
+            implicit_requirements=(
+                frozenset(req for reqs in implicit_reqs.values() for req in reqs)
+                if implicit_reqs else None
+            )
+        )
+    
+    def validate_prompt_quality(
+        self,
+        prompt: str,
+        context: Union[dict, ValidationContext],
+        min_quality: Optional[str] = None
+    ) -> ValidationResult:
+        """Validate the quality of a generated prompt.
+        
+        The context may be an analysis dict or a ValidationContext from
+        prepare_context, which avoids re-normalizing it for every prompt.
+        When min_quality names a quality level, checks run in descending weight
+        order and stop once the remaining checks can no longer lift the prompt to
+        that level. Such a prompt is reported as POOR with the scores computed so far.
+        """
+        
+        if not isinstance(context, ValidationContext):
+            context = self.prepare_context(context)
+        prompt_lower = prompt.lower()
+        found = {indicator for indicator in _ALL_INDICATORS if indicator in prompt_lower}
+        target = _QUALITY_THRESHOLDS[min_quality] if min_quality else None
         scores = {}
         total_score = 0
         feedback = []
         
-        # Check completeness
-        completeness_score = self._check_completeness(prompt)
-        scores["completeness"] = completeness_score
-        total_score += completeness_score * self.validation_criteria["completeness"]["weight"]
-        
-        if completeness_score < 0.8:
-            feedback.append("Prompt is missing key sections - add more comprehensive requirements")
-        
-        # Check specificity
-        specificity_score = self._check_specificity(prompt, context)
-        scores["specificity"] = specificity_score
-        total_score += specificity_score * self.validation_criteria["specificity"]["weight"]
-        
-        if specificity_score < 0.7:
-            feedback.append("Prompt needs more specific technical details and service configurations")
-        
-        # Check actionability
-        actionability_score = self._check_actionability(prompt)
-        scores["actionability"] = actionability_score
-        total_score += actionability_score * self.validation_criteria["actionability"]["weight"]
-        
-        if actionability_score < 0.7:
-            feedback.append("Prompt needs more actionable instructions and concrete examples")
-        
-        # Check context awareness
-        context_score = self._check_context_awareness(prompt, context)
-        scores["context_awareness"] = context_score
-        total_score += context_score * self.validation_criteria["context_awareness"]["weight"]
-        
-        if context_score < 0.7:
-            feedback.append("Prompt should better incorporate user's specific context and requirements")
+        for name, weight, remaining_weight, check, threshold, message in self._checks:
+            score = check(prompt_lower, found, context)
+            scores[name] = score
+            total_score += score * weight
+            
+            if score < threshold:
+                feedback.append(message)
+            
+            if target is not None and total_score + remaining_weight < target:
+                return ValidationResult(
+                    total_score,
+                    scores,
+                    feedback,
+                    "POOR",
+                    self._generate_improvement_suggestions(scores, context)
+                )
         
-        return {
-            "overall_score": total_score,
-            "component_scores": scores,
-            "feedback": feedback,
-            "quality_level": self._get_quality_level(total_score),
-            "improvement_suggestions": self._generate_improvement_suggestions(scores, context)
-        }
+        return ValidationResult(
+            total_score,
+            scores,
+            feedback,
+            self._get_quality_level(total_score),
+            self._generate_improvement_suggestions(scores, context)
+        )
     
-    def _check_completeness(self, prompt: str) -> float:
+    def _check_completeness(self, prompt_lower: str, found: set, context: ValidationContext) -> float:
         """Check if prompt covers all necessary sections."""
         
-        prompt_lower = prompt.lower()
-        required_sections = self.validation_criteria["completeness"]["required_sections"]
-        
         found_sections = 0
-        for section in required_sections:
+        for section in self._required_sections:
             if section in prompt_lower:
                 found_sections += 1
         
         # Additional completeness checks
-        completeness_indicators = [
-            "parameters", "outputs", "resources", "security", "monitoring",
-            "backup", "scaling", "networking", "iam", "encryption"
-        ]
-        
-        found_indicators = sum(1 for indicator in completeness_indicators if indicator in prompt_lower)
-        indicator_score = min(found_indicators / len(completeness_indicators), 1.0)
+        found_indicators = len(found & _COMPLETENESS_INDICATORS)
+        indicator_score = min(found_indicators / len(_COMPLETENESS_INDICATORS), 1.0)
         
-        section_score = found_sections / len(required_sections)
+        section_score = found_sections / len(self._required_sections)
         
         return (section_score * 0.6) + (indicator_score * 0.4)
     
-    def _check_specificity(self, prompt: str, context: dict) -> float:
+    def _check_specificity(self, prompt_lower: str, found: set, context: ValidationContext) -> float:
         """Check how specific and detailed the prompt is."""
         
-        prompt_lower = prompt.lower()
-        
         # Check for specific AWS services mentioned
-        aws_services = [
-            "ec2", "s3", "rds", "lambda", "api gateway", "cloudfront", "route53",
-            "alb", "elb", "vpc", "iam", "kms", "dynamodb", "kinesis", "sqs", "sns"
-        ]
-        
-        mentioned_services = sum(1 for service in aws_services if service in prompt_lower)
+        mentioned_services = len(found & _AWS_SERVICES)
         service_score = min(mentioned_services / 5, 1.0)  # Normalize to max 5 services
         
         # Check for specific configuration parameters
-        config_indicators = [
-            "instance type", "storage size", "memory", "cpu", "port", "protocol",
-            "cidr", "subnet", "availability zone", "region", "encryption key"
-        ]
-        
-        config_mentions = sum(1 for config in config_indicators if config in prompt_lower)
-        config_score = min(config_mentions / len(config_indicators), 1.0)
+        config_mentions = len(found & _CONFIG_INDICATORS)
+        config_score = min(config_mentions / len(_CONFIG_INDICATORS), 1.0)
         
         # Check for performance metrics
-        performance_indicators = [
-            "requests per second", "concurrent users", "latency", "throughput",
-            "storage capacity", "bandwidth", "iops", "connections"
-        ]
-        
-        perf_mentions = sum(1 for perf in performance_indicators if perf in prompt_lower)
+        perf_mentions = len(found & _PERFORMANCE_INDICATORS)
         perf_score = min(perf_mentions / 4, 1.0)
         
         return (service_score * 0.4) + (config_score * 0.4) + (perf_score * 0.2)
     
-    def _check_actionability(self, prompt: str) -> float:
+    def _check_actionability(self, prompt_lower: str, found: set, context: ValidationContext) -> float:
         """Check how actionable and practical the prompt is."""
         
-        prompt_lower = prompt.lower()
-        
         # Check for step-by-step instructions
-        instruction_indicators = [
-            "step 1", "step 2", "first", "then", "next", "finally",
-            "create", "configure", "deploy", "validate", "test"
-        ]
-        
-        instruction_count = sum(1 for indicator in instruction_indicators if indicator in prompt_lower)
+        instruction_count = len(found & _INSTRUCTION_INDICATORS)
         instruction_score = min(instruction_count / 8, 1.0)
         
         # Check for CLI commands
-        cli_indicators = ["aws ", "cloudformation", "describe-", "create-", "update-", "delete-"]
-        cli_count = sum(1 for cli in cli_indicators if cli in prompt_lower)
+        cli_count = len(found & _CLI_INDICATORS)
         cli_score = min(cli_count / 5, 1.0)
         
         # Check for examples and templates
-        example_indicators = ["example", "template", "sample", "format:", "```"]
-        example_count = sum(1 for example in example_indicators if example in prompt_lower)
+        example_count = len(found & _EXAMPLE_INDICATORS)
         example_score = min(example_count / 3, 1.0)
         
         return (instruction_score * 0.4) + (cli_score * 0.3) + (example_score * 0.3)
     
-    def _check_context_awareness(self, prompt: str, context: dict) -> float:
+    def _check_context_awareness(self, prompt_lower: str, found: set, context: ValidationContext) -> float:
         """Check how well the prompt incorporates user context."""
         
-        prompt_lower = prompt.lower()
-        
         # Check if user's architecture type is properly addressed
-        arch_type = context.get("architecture_type", "")
+        arch_type = context.architecture_type_lower
         if arch_type and arch_type in prompt_lower:
             arch_score = 1.0
         else:
             arch_score = 0.5
         
         # Check if compliance requirements are addressed
-        compliance_reqs = context.get("compliance_requirements", [])
+        compliance_reqs = context.compliance_requirements_lower
         compliance_score = 0
         if compliance_reqs:
             mentioned_compliance = sum(1 for req in compliance_reqs if req in prompt_lower)
@@ -196,23 +296,17 @@ class PromptValidator:
             compliance_score = 1.0  # No requirements to check
         
         # Check if scale considerations are included
-        scale = context.get("scale", "")
-        scale_indicators = ["scale", "performance", "traffic", "load", "capacity"]
-        scale_mentions = sum(1 for indicator in scale_indicators if indicator in prompt_lower)
+        scale_mentions = len(found & _SCALE_INDICATORS)
         scale_score = min(scale_mentions / 3, 1.0)
         
         # Check if implicit requirements are addressed
-        implicit_reqs = context.get("implicit_requirements", {})
+        implicit_reqs = context.implicit_requirements
         implicit_score = 0
-        if implicit_reqs:
-            total_implicit = sum(len(reqs) for reqs in implicit_reqs.values())
-            if total_implicit > 0:
+        if implicit_reqs is not None:
+            if implicit_reqs:
                 # Check if security, performance, operational aspects are covered
-                covered_aspects = 0
-                if "security" in prompt_lower: covered_aspects += 1
-                if "performance" in prompt_lower: covered_aspects += 1
-                if "operational" in prompt_lower or "monitoring" in prompt_lower: covered_aspects += 1
-                implicit_score = covered_aspects / 3
+                covered_aspects = sum(1 for aspect in _IMPLICIT_ASPECTS if not found.isdisjoint(aspect))
+                implicit_score = covered_aspects / len(_IMPLICIT_ASPECTS)
         else:
             implicit_score = 1.0
         
@@ -221,45 +315,39 @@ class PromptValidator:
     def _get_quality_level(self, score: float) -> str:
         """Determine quality level based on score."""
         
-        if score >= 0.9:
-            return "EXCELLENT"
-        elif score >= 0.8:
-            return "GOOD"
-        elif score >= 0.7:
-            return "ACCEPTABLE"
-        elif score >= 0.6:
-            return "NEEDS_IMPROVEMENT"
-        else:
-            return "POOR"
+        for level, threshold in _QUALITY_THRESHOLDS.items():
+            if score >= threshold:
+                return level
+        return "POOR"
     
-    def _generate_improvement_suggestions(self, scores: dict, context: dict) -> list:
+    def _generate_improvement_suggestions(self, scores: dict, context: ValidationContext) -> list:
         """Generate specific suggestions for improving the prompt."""
         
         suggestions = []
         
-        if scores["completeness"] < 0.8:
+        if scores.get("completeness", 1.0) < 0.8:
             suggestions.append(
                 "Add more comprehensive sections covering security, monitoring, backup, and operational requirements"
             )
         
-        if scores["specificity"] < 0.7:
+        if scores.get("specificity", 1.0) < 0.7:
             suggestions.append(
                 "Include more specific AWS service configurations, instance types, and performance parameters"
             )
         
-        if scores["actionability"] < 0.7:
+        if scores.get("actionability", 1.0) < 0.7:
             suggestions.append(
                 "Add step-by-step instructions, CLI commands, and concrete examples"
             )
         
-        if scores["context_awareness"] < 0.7:
-            arch_type = context.get("architecture_type", "")
+        if scores.get("context_awareness", 1.0) < 0.7:
+            arch_type = context.architecture_type
             if arch_type:
                 suggestions.append(
                     f"Better incorporate {arch_type} architecture-specific requirements and best practices"
                 )
             
-            compliance_reqs = context.get("compliance_requirements", [])
+            compliance_reqs = context.compliance_requirements
             if compliance_reqs:
                 suggestions.append(
                     f"Address {', '.join(compliance_reqs)} compliance requirements more thoroughly"
@@ -267,19 +355,27 @@ class PromptValidator:
         
         return suggestions
     
-    def enhance_prompt_based_on_validation(self, prompt: str, validation_result: dict, context: dict) -> str:
+    def enhance_prompt_based_on_validation(
+        self,
+        prompt: str,
+        validation_result: Union[dict, ValidationResult],
+        context: dict
+    ) -> str:
         """Enhance a prompt based on validation feedback."""
         
-        if validation_result["quality_level"] in ["EXCELLENT", "GOOD"]:
+        if isinstance(validation_result, dict):
+            validation_result = ValidationResult(**validation_result)
+        
+        if validation_result.quality_level in ["EXCELLENT", "GOOD"]:
             return prompt  # Already good enough
         
         enhancement_prompt = f"""
 PROMPT QUALITY ANALYSIS:
-- Overall Score: {validation_result['overall_score']:.2f}
-- Quality Level: {validation_result['quality_level']}
+- Overall Score: {validation_result.overall_score:.2f}
+- Quality Level: {validation_result.quality_level}
 
 IMPROVEMENT NEEDED:
-{chr(10).join(f"- {suggestion}" for suggestion in validation_result['improvement_suggestions'])}
+{chr(10).join(f"- {suggestion}" for suggestion in validation_result.improvement_suggestions)}
 
 ORIGINAL PROMPT:
 {prompt}
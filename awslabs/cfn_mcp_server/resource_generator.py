@@ -14,11 +14,114 @@
 
 """Resource generation logic for CloudFormation templates."""
 
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Any, NamedTuple, Optional, Tuple
 import uuid
 
 from awslabs.cfn_mcp_server.config import config_manager
 
+# Every phrase a generator looks for in the description, probed once per call
+_DESCRIPTION_KEYWORDS = frozenset({
+    # Lambda runtime, architecture, environment and policies
+    'node', 'javascript', 'js', 'java', 'go', 'golang', 'ruby', 'dotnet', 'c#', 'csharp',
+    'x86', 'intel', 'amd64', 'environment', 'env var', 's3', 'bucket', 'dynamodb', 'dynamo',
+    # DynamoDB secondary indexes
+    'index', 'query', 'search',
+    # EC2 operating system and security group type
+    'amazon linux 2023', 'al2023', 'api', 'backend', 'database', 'db',
+    # RDS engine
+    'postgres', 'mysql', 'mariadb', 'aurora',
+    # Kinesis capacity
+    'high throughput', 'high volume', 'on demand', 'auto scaling',
+    # VPC private subnets
+    'private',
+})
+
+# Lambda languages as (keywords, runtime key, handler, inline code), checked in order
+_LAMBDA_LANGUAGES = (
+    (
+        frozenset({'node', 'javascript', 'js'}), 'nodejs', 'index.handler',
+        'exports.handler = async (event) => {\n    return {\n        statusCode: 200,\n        body: "Hello from Node.js Lambda!"\n    };\n};',
+    ),
+    (
+        frozenset({'java'}), 'java', 'example.Handler::handleRequest',
+        '// Java code would be provided as a JAR or ZIP file\n// This is a placeholder',
+    ),
+    (
+        frozenset({'go', 'golang'}), 'go', 'main',
+        '// Go code would be provided as a ZIP file\n// This is a placeholder',
+    ),
+    (
+        frozenset({'ruby'}), 'ruby', 'index.handler',
+        'def handler(event:, context:)\n  { statusCode: 200, body: "Hello from Ruby Lambda!" }\nend',
+    ),
+    (
+        frozenset({'dotnet', 'c#', 'csharp'}), 'dotnet', 'Assembly::Namespace.Class::Method',
+        '// .NET code would be provided as a ZIP file\n// This is a placeholder',
+    ),
+)
+_LAMBDA_DEFAULT_LANGUAGE = (
+    'python', 'index.handler',
+    'def handler(event, context):\n    return {"statusCode": 200, "body": "Hello from Python Lambda!"}',
+)
+
+_LAMBDA_BASIC_EXECUTION_POLICY = "arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole"
+
+# Managed policies granted to Lambda roles as (keywords, policy ARN), in order
+_LAMBDA_POLICY_HINTS = (
+    (frozenset({'s3', 'bucket'}), "arn:aws:iam::aws:policy/AmazonS3ReadOnlyAccess"),
+    (frozenset({'dynamodb', 'dynamo'}), "arn:aws:iam::aws:policy/AmazonDynamoDBReadOnlyAccess"),
+)
+
+# RDS engines as (keyword, engine, version), checked in order; MySQL is the default
+_RDS_ENGINES = (
+    ('postgres', 'postgres', '15.3'),
+    ('mysql', 'mysql', '8.0.33'),
+    ('mariadb', 'mariadb', '10.6.14'),
+)
+_RDS_DEFAULT_ENGINE = ('mysql', '8.0.33')
+
+# Aurora flavour of the engine picked above; anything but PostgreSQL runs Aurora MySQL
+_AURORA_ENGINES = {'postgres': ('aurora-postgresql', '15.3')}
+_AURORA_DEFAULT_ENGINE = ('aurora-mysql', '8.0.mysql_aurora.3.04.0')
+
+# Scalar-only load balancer settings; safe to merge into every resource without copying
+_ALB_PROPERTIES = MappingProxyType({
+    "Scheme": "internet-facing",
+    "Type": "application",
+    "IpAddressType": "ipv4",
+})
+
+
+@lru_cache(maxsize=64)
+def _lambda_managed_policies(keywords: FrozenSet[str]) -> Tuple[str, ...]:
+    """Managed policy ARNs for a Lambda role, shared by roles with the same keywords.
+
+    Hint entries may grant the same ARN; each is listed once, in first-seen order.
+    """
+    return tuple(dict.fromkeys((
+        _LAMBDA_BASIC_EXECUTION_POLICY,
+        *(arn for hints, arn in _LAMBDA_POLICY_HINTS if not hints.isdisjoint(keywords)),
+    )))
+
+
+def _stack_sub(key: str, suffix: str) -> Dict[str, str]:
+    """Build a stack-prefixed ``Fn::Sub`` name such as ``${AWS::StackName}-api-bucket``."""
+    return {"Fn::Sub": f"${{AWS::StackName}}-{key}-{suffix}"}
+
+
+class _GenerationContext(NamedTuple):
+    """Analysis-derived facts shared by every generator in one call."""
+
+    keywords: FrozenSet[str]
+    resource_types: FrozenSet[str] = frozenset()
+    performance_tier: str = 'standard'
+    encryption: bool = False
+    high_availability: bool = False
+    multi_az: bool = False
+
+
 class ResourceGenerator:
     """Generates CloudFormation resources with intelligent configurations."""
     
@@ -29,6 +132,35 @@ class ResourceGenerator:
             config: Optional configuration manager instance
         """
         self.config = config or config_manager
+        
+        # Configuration lookups memoized for this generator and its config
+        self._resource_config_cache: Dict[Tuple[str, str, str, Any], Any] = {}
+        self._config_value_cache: Dict[Tuple[str, Any], Any] = {}
+    
+    def clear_config_cache(self) -> None:
+        """Forget memoized configuration lookups, e.g. after the configuration changes."""
+        self._resource_config_cache.clear()
+        self._config_value_cache.clear()
+    
+    def _resource_config(self, resource_type: str, tier: str, config_key: str, default: Any = None) -> Any:
+        """Get a per-tier resource setting from the configuration."""
+        key = (resource_type, tier, config_key, default)
+        try:
+            return self._resource_config_cache[key]
+        except KeyError:
+            value = self._resource_config_cache[key] = self.config.get_resource_config(
+                resource_type, tier, config_key, default
+            )
+            return value
+    
+    def _config_value(self, path: str, default: Any = None) -> Any:
+        """Get a configuration value by dot-notation path."""
+        key = (path, default)
+        try:
+            return self._config_value_cache[key]
+        except KeyError:
+            value = self._config_value_cache[key] = self.config.get_config(path, default)
+            return value
     
     def generate_resources(
         self, 
@@ -36,40 +168,36 @@ class ResourceGenerator:
     ) -> Dict[str, Dict[str, Any]]:
         """Generate CloudFormation resources based on analysis."""
         resources = {}
+        add_resources = resources.update
         parameters = {}
         
-        # Generate resources based on identified types
+        description = analysis.get('original_description', '').lower()
+        security = analysis.get('security_requirements') or {}
+        scale = analysis.get('scale_requirements') or {}
+        ctx = _GenerationContext(
+            keywords=frozenset(k for k in _DESCRIPTION_KEYWORDS if k in description),
+            resource_types=frozenset(analysis['resources'].values()),
+            performance_tier=scale.get('performance_tier', 'standard'),
+            encryption=bool(security.get('encryption')),
+            high_availability=bool(scale.get('high_availability')),
+            multi_az=bool(scale.get('multi_az')),
+        )
+        
+        # Generate resources based on identified types; unknown types are skipped
         for resource_key, resource_type in analysis['resources'].items():
-            if resource_type == 'AWS::S3::Bucket':
-                resources.update(self._generate_s3_bucket(resource_key, analysis))
-            elif resource_type == 'AWS::Lambda::Function':
-                resources.update(self._generate_lambda_function(resource_key, analysis))
-            elif resource_type == 'AWS::DynamoDB::Table':
-                resources.update(self._generate_dynamodb_table(resource_key, analysis))
-            elif resource_type == 'AWS::ApiGateway::RestApi':
-                resources.update(self._generate_api_gateway(resource_key, analysis))
-            elif resource_type == 'AWS::EC2::Instance':
-                resources.update(self._generate_ec2_instance(resource_key, analysis))
-            elif resource_type == 'AWS::RDS::DBInstance':
-                resources.update(self._generate_rds_instance(resource_key, analysis))
-            elif resource_type == 'AWS::ElasticLoadBalancingV2::LoadBalancer':
-                resources.update(self._generate_load_balancer(resource_key, analysis))
-            elif resource_type == 'AWS::ECS::Service':
-                resources.update(self._generate_ecs_service(resource_key, analysis))
-            elif resource_type == 'AWS::CloudFront::Distribution':
-                resources.update(self._generate_cloudfront(resource_key, analysis))
-            elif resource_type == 'AWS::Kinesis::Stream':
-                resources.update(self._generate_kinesis_stream(resource_key, analysis))
+            generator = self._GENERATORS.get(resource_type)
+            if generator:
+                add_resources(generator(self, resource_key, analysis, ctx))
         
         # Add supporting resources
-        if analysis.get('security_requirements', {}).get('vpc_isolation'):
-            resources.update(self._generate_vpc_resources(analysis))
+        if security.get('vpc_isolation'):
+            add_resources(self._generate_vpc_resources(analysis, ctx))
         
         # Add IAM roles where needed
-        resources.update(self._generate_iam_resources(analysis))
+        add_resources(self._generate_iam_resources(analysis, ctx))
         
         # Generate parameters for resources that need them
-        if any('AWS::RDS::DBInstance' in str(v) for v in analysis.get('resources', {}).values()):
+        if 'AWS::RDS::DBInstance' in ctx.resource_types:
             parameters.update(self._generate_database_parameters())
         
         return {"resources": resources, "parameters": parameters}
@@ -97,14 +225,14 @@ class ResourceGenerator:
             }
         }
 
-    def _generate_s3_bucket(self, key: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_s3_bucket(self, key: str, analysis: Dict[str, Any], ctx: _GenerationContext) -> Dict[str, Any]:
         """Generate S3 bucket configuration."""
         bucket_name = f"{key.title()}Bucket"
         
         config = {
             "Type": "AWS::S3::Bucket",
             "Properties": {
-                "BucketName": {"Fn::Sub": f"${{AWS::StackName}}-{key}-bucket"},
+                "BucketName": _stack_sub(key, "bucket"),
                 "VersioningConfiguration": {"Status": "Enabled"},
                 "PublicAccessBlockConfiguration": {
                     "BlockPublicAcls": True,
@@ -116,7 +244,7 @@ class ResourceGenerator:
         }
         
         # Add encryption if required
-        if analysis.get('security_requirements', {}).get('encryption'):
+        if ctx.encryption:
             config["Properties"]["BucketEncryption"] = {
                 "ServerSideEncryptionConfiguration": [{
                     "ServerSideEncryptionByDefault": {
@@ -139,56 +267,36 @@ class ResourceGenerator:
         
         return {bucket_name: config}
     
-    def _generate_lambda_function(self, key: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_lambda_function(self, key: str, analysis: Dict[str, Any], ctx: _GenerationContext) -> Dict[str, Any]:
         """Generate Lambda function configuration."""
         function_name = f"{key.title()}Function"
-        role_name = f"{key.title()}FunctionRole"
+        role_name = f"{function_name}Role"
         
         # Determine runtime based on description
-        description = analysis.get('original_description', '').lower()
+        keywords = ctx.keywords
         
-        # Default to Python
-        runtime_key = 'python'
-        handler = 'index.handler'
-        code = 'def handler(event, context):\n    return {"statusCode": 200, "body": "Hello from Python Lambda!"}'
-        
-        # Check for specific languages in description
-        if 'node' in description or 'javascript' in description or 'js' in description:
-            runtime_key = 'nodejs'
-            handler = 'index.handler'
-            code = 'exports.handler = async (event) => {\n    return {\n        statusCode: 200,\n        body: "Hello from Node.js Lambda!"\n    };\n};'
-        elif 'java' in description:
-            runtime_key = 'java'
-            handler = 'example.Handler::handleRequest'
-            code = '// Java code would be provided as a JAR or ZIP file\n// This is a placeholder'
-        elif 'go' in description or 'golang' in description:
-            runtime_key = 'go'
-            handler = 'main'
-            code = '// Go code would be provided as a ZIP file\n// This is a placeholder'
-        elif 'ruby' in description:
-            runtime_key = 'ruby'
-            handler = 'index.handler'
-            code = 'def handler(event:, context:)\n  { statusCode: 200, body: "Hello from Ruby Lambda!" }\nend'
-        elif 'dotnet' in description or 'c#' in description or 'csharp' in description:
-            runtime_key = 'dotnet'
-            handler = 'Assembly::Namespace.Class::Method'
-            code = '// .NET code would be provided as a ZIP file\n// This is a placeholder'
+        # First language mentioned in table order wins; Python is the default
+        runtime_key, handler, code = next(
+            (language[1:] for language in _LAMBDA_LANGUAGES if language[0] & keywords),
+            _LAMBDA_DEFAULT_LANGUAGE,
+        )
         
         # Get runtime from configuration
-        runtime = self.config.get_config(f'resources.lambda.runtimes.{runtime_key}', 'python3.11')
+        runtime = self._config_value(f'resources.lambda.runtimes.{runtime_key}', 'python3.11')
         
         # Determine performance tier
-        perf_tier = analysis.get('scale_requirements', {}).get('performance_tier', 'standard')
+        perf_tier = ctx.performance_tier
         
         # Get memory and timeout from configuration
-        memory_size = self.config.get_resource_config('lambda', perf_tier, 'memory_sizes', 256)
-        timeout = self.config.get_resource_config('lambda', perf_tier, 'timeouts', 30)
+        resource_config = self._resource_config
+        memory_size = resource_config('lambda', perf_tier, 'memory_sizes', 256)
+        timeout = resource_config('lambda', perf_tier, 'timeouts', 30)
         
         # Function configuration
         function_config = {
             "Type": "AWS::Lambda::Function",
             "Properties": {
-                "FunctionName": {"Fn::Sub": f"${{AWS::StackName}}-{key}-function"},
+                "FunctionName": _stack_sub(key, "function"),
                 "Runtime": runtime,
                 "Handler": handler,
                 "Code": {"ZipFile": code},
@@ -199,7 +307,7 @@ class ResourceGenerator:
         }
         
         # Add architecture - ARM for better price/performance if not specified otherwise
-        if not any(arch in description for arch in ['x86', 'intel', 'amd64']):
+        if not any(arch in keywords for arch in ['x86', 'intel', 'amd64']):
             function_config["Properties"]["Architectures"] = ["arm64"]
         
         # Add tracing for non-basic tiers
@@ -207,7 +315,7 @@ class ResourceGenerator:
             function_config["Properties"]["TracingConfig"] = {"Mode": "Active"}
         
         # Add environment variables if mentioned in description
-        if 'environment' in description or 'env var' in description:
+        if 'environment' in keywords or 'env var' in keywords:
             function_config["Properties"]["Environment"] = {
                 "Variables": {
                     "ENVIRONMENT": {"Ref": "AWS::StackName"},
@@ -216,13 +324,7 @@ class ResourceGenerator:
             }
         
         # Determine required policies based on description
-        managed_policies = ["arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole"]
-        
-        if 's3' in description or 'bucket' in description:
-            managed_policies.append("arn:aws:iam::aws:policy/AmazonS3ReadOnlyAccess")
-        
-        if 'dynamodb' in description or 'dynamo' in description:
-            managed_policies.append("arn:aws:iam::aws:policy/AmazonDynamoDBReadOnlyAccess")
+        managed_policies = list(_lambda_managed_policies(keywords))
         
         # IAM Role
         role_config = {
@@ -245,21 +347,21 @@ class ResourceGenerator:
             role_name: role_config
         }
     
-    def _generate_dynamodb_table(self, key: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_dynamodb_table(self, key: str, analysis: Dict[str, Any], ctx: _GenerationContext) -> Dict[str, Any]:
         """Generate DynamoDB table configuration."""
         table_name = f"{key.title()}Table"
         
         # Determine performance tier
-        perf_tier = analysis.get('scale_requirements', {}).get('performance_tier', 'standard')
+        perf_tier = ctx.performance_tier
         
         # Get billing mode from configuration
-        billing_mode = self.config.get_resource_config('dynamodb', perf_tier, 'billing_modes', 'PAY_PER_REQUEST')
+        billing_mode = self._resource_config('dynamodb', perf_tier, 'billing_modes', 'PAY_PER_REQUEST')
         
         # Basic table configuration
         config = {
             "Type": "AWS::DynamoDB::Table",
             "Properties": {
-                "TableName": {"Fn::Sub": f"${{AWS::StackName}}-{key}-table"},
+                "TableName": _stack_sub(key, "table"),
                 "BillingMode": billing_mode,
                 "AttributeDefinitions": [
                     {"AttributeName": "id", "AttributeType": "S"}
@@ -272,8 +374,9 @@ class ResourceGenerator:
         
         # Add provisioned capacity if not using on-demand
         if billing_mode == 'PROVISIONED':
-            read_capacity = self.config.get_config('resources.dynamodb.provisioned_capacity.read', 5)
-            write_capacity = self.config.get_config('resources.dynamodb.provisioned_capacity.write', 5)
+            config_value = self._config_value
+            read_capacity = config_value('resources.dynamodb.provisioned_capacity.read', 5)
+            write_capacity = config_value('resources.dynamodb.provisioned_capacity.write', 5)
             
             config["Properties"]["ProvisionedThroughput"] = {
                 "ReadCapacityUnits": read_capacity,
@@ -281,20 +384,20 @@ class ResourceGenerator:
             }
         
         # Add encryption for all but basic tier
-        if analysis.get('security_requirements', {}).get('encryption') or perf_tier != 'basic':
+        if ctx.encryption or perf_tier != 'basic':
             config["Properties"]["SSESpecification"] = {
                 "SSEEnabled": True
             }
         
         # Add point-in-time recovery for standard and high tiers
-        if analysis.get('scale_requirements', {}).get('high_availability') or perf_tier != 'basic':
+        if ctx.high_availability or perf_tier != 'basic':
             config["Properties"]["PointInTimeRecoverySpecification"] = {
                 "PointInTimeRecoveryEnabled": True
             }
             
         # Add global secondary index if mentioned in description
-        description = analysis.get('original_description', '').lower()
-        if 'index' in description or 'query' in description or 'search' in description:
+        keywords = ctx.keywords
+        if 'index' in keywords or 'query' in keywords or 'search' in keywords:
             # Add a GSI for common query patterns
             config["Properties"]["GlobalSecondaryIndexes"] = [
                 {
@@ -322,14 +425,14 @@ class ResourceGenerator:
         
         return {table_name: config}
     
-    def _generate_api_gateway(self, key: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_api_gateway(self, key: str, analysis: Dict[str, Any], ctx: _GenerationContext) -> Dict[str, Any]:
         """Generate API Gateway configuration."""
         api_name = f"{key.title()}Api"
         
         config = {
             "Type": "AWS::ApiGateway::RestApi",
             "Properties": {
-                "Name": {"Fn::Sub": f"${{AWS::StackName}}-{key}-api"},
+                "Name": _stack_sub(key, "api"),
                 "Description": f"API Gateway for {analysis.get('original_description', 'application')}",
                 "EndpointConfiguration": {
                     "Types": ["REGIONAL"]
@@ -339,22 +442,23 @@ class ResourceGenerator:
         
         return {api_name: config}
     
-    def _generate_ec2_instance(self, key: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_ec2_instance(self, key: str, analysis: Dict[str, Any], ctx: _GenerationContext) -> Dict[str, Any]:
         """Generate EC2 instance configuration."""
-        instance_name = f"{key.title()}Instance"
-        sg_name = f"{key.title()}SecurityGroup"
+        prefix = key.title()
+        instance_name = f"{prefix}Instance"
+        sg_name = f"{prefix}SecurityGroup"
         
         # Determine instance type based on performance requirements
-        perf_tier = analysis.get('scale_requirements', {}).get('performance_tier', 'standard')
-        instance_type = self.config.get_resource_config('ec2', perf_tier, 'performance_tiers', 't3.small')
+        perf_tier = ctx.performance_tier
+        instance_type = self._resource_config('ec2', perf_tier, 'performance_tiers', 't3.small')
         
         # Get the latest AMI for the region
-        region = analysis.get('region', self.config.get_config('aws.default_region'))
+        region = analysis.get('region', self._config_value('aws.default_region'))
         os_type = 'amazon-linux-2'
         
         # Check if a specific OS is mentioned in the description
-        description = analysis.get('original_description', '').lower()
-        if 'amazon linux 2023' in description or 'al2023' in description:
+        keywords = ctx.keywords
+        if 'amazon linux 2023' in keywords or 'al2023' in keywords:
             os_type = 'amazon-linux-2023'
         
         # Get the latest AMI ID
@@ -367,40 +471,38 @@ class ResourceGenerator:
                 "InstanceType": instance_type,
                 "SecurityGroupIds": [{"Ref": sg_name}],
                 "Tags": [
-                    {"Key": "Name", "Value": {"Fn::Sub": f"${{AWS::StackName}}-{key}-instance"}}
+                    {"Key": "Name", "Value": _stack_sub(key, "instance")}
                 ]
             }
         }
         
         # Determine security group type based on description
         sg_type = "web"  # Default to web security group
-        if 'api' in description or 'backend' in description:
+        if 'api' in keywords or 'backend' in keywords:
             sg_type = "api"
-        elif 'database' in description or 'db' in description:
+        elif 'database' in keywords or 'db' in keywords:
             sg_type = "database"
         
         # Get security group rules from configuration
         sg_rules = self.config.get_security_group_config(sg_type)
-        sg_ingress = []
         
-        for rule in sg_rules:
-            sg_ingress.append({
+        # Fall back to SSH access if no rules are defined
+        sg_ingress = [
+            {
                 "IpProtocol": "tcp",
-                "FromPort": rule.get('port'),
-                "ToPort": rule.get('port'),
+                "FromPort": (port := rule.get('port')),
+                "ToPort": port,
                 "CidrIp": rule.get('cidr')
-            })
-        
-        # Add default SSH access if no rules defined
-        if not sg_ingress:
-            sg_ingress = [
-                {
-                    "IpProtocol": "tcp",
-                    "FromPort": 22,
-                    "ToPort": 22,
-                    "CidrIp": "0.0.0.0/0"
-                }
-            ]
+            }
+            for rule in sg_rules
+        ] or [
+            {
+                "IpProtocol": "tcp",
+                "FromPort": 22,
+                "ToPort": 22,
+                "CidrIp": "0.0.0.0/0"
+            }
+        ]
         
         # Security Group
         sg_config = {
@@ -416,46 +518,33 @@ class ResourceGenerator:
             sg_name: sg_config
         }
     
-    def _generate_rds_instance(self, key: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_rds_instance(self, key: str, analysis: Dict[str, Any], ctx: _GenerationContext) -> Dict[str, Any]:
         """Generate RDS instance configuration."""
         db_name = f"{key.title()}Database"
         
         # Determine engine based on description
-        description = analysis.get('original_description', '').lower()
-        if 'postgres' in description:
-            engine = 'postgres'
-            engine_version = '15.3'
-        elif 'mysql' in description:
-            engine = 'mysql'
-            engine_version = '8.0.33'
-        elif 'mariadb' in description:
-            engine = 'mariadb'
-            engine_version = '10.6.14'
-        elif 'aurora' in description:
-            if 'postgres' in description:
-                engine = 'aurora-postgresql'
-                engine_version = '15.3'
-            else:
-                engine = 'aurora-mysql'
-                engine_version = '8.0.mysql_aurora.3.04.0'
-        else:
-            engine = 'mysql'
-            engine_version = '8.0.33'
+        engine, engine_version = next(
+            (candidate[1:] for candidate in _RDS_ENGINES if candidate[0] in ctx.keywords),
+            _RDS_DEFAULT_ENGINE,
+        )
+        if 'aurora' in ctx.keywords:
+            engine, engine_version = _AURORA_ENGINES.get(engine, _AURORA_DEFAULT_ENGINE)
         
         # Determine performance tier
-        perf_tier = analysis.get('scale_requirements', {}).get('performance_tier', 'standard')
+        perf_tier = ctx.performance_tier
         
         # Get instance class from configuration
-        instance_class = self.config.get_resource_config('rds', perf_tier, 'performance_tiers', 'db.t3.small')
+        resource_config = self._resource_config
+        instance_class = resource_config('rds', perf_tier, 'performance_tiers', 'db.t3.small')
         
         # Get storage and backup settings from configuration
-        allocated_storage = str(self.config.get_resource_config('rds', perf_tier, 'default_storage', 20))
-        backup_retention = self.config.get_resource_config('rds', perf_tier, 'backup_retention', 7)
+        allocated_storage = str(resource_config('rds', perf_tier, 'default_storage', 20))
+        backup_retention = resource_config('rds', perf_tier, 'backup_retention', 7)
         
         config = {
             "Type": "AWS::RDS::DBInstance",
             "Properties": {
-                "DBInstanceIdentifier": {"Fn::Sub": f"${{AWS::StackName}}-{key}-db"},
+                "DBInstanceIdentifier": _stack_sub(key, "db"),
                 "DBInstanceClass": instance_class,
                 "Engine": engine,
                 "EngineVersion": engine_version,
@@ -469,11 +558,11 @@ class ResourceGenerator:
         }
         
         # Add Multi-AZ for high availability
-        if analysis.get('scale_requirements', {}).get('high_availability') or perf_tier == 'high':
+        if ctx.high_availability or perf_tier == 'high':
             config["Properties"]["MultiAZ"] = True
         
         # Add encryption if required or for high tier
-        if analysis.get('security_requirements', {}).get('encryption') or perf_tier == 'high':
+        if ctx.encryption or perf_tier == 'high':
             config["Properties"]["StorageEncrypted"] = True
             
         # Add performance insights for standard and high tiers
@@ -483,39 +572,35 @@ class ResourceGenerator:
         
         return {db_name: config}
     
-    def _generate_load_balancer(self, key: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_load_balancer(self, key: str, analysis: Dict[str, Any], ctx: _GenerationContext) -> Dict[str, Any]:
         """Generate Application Load Balancer configuration."""
         alb_name = f"{key.title()}LoadBalancer"
         
         config = {
             "Type": "AWS::ElasticLoadBalancingV2::LoadBalancer",
-            "Properties": {
-                "Name": {"Fn::Sub": f"${{AWS::StackName}}-{key}-alb"},
-                "Scheme": "internet-facing",
-                "Type": "application",
-                "IpAddressType": "ipv4"
-            }
+            "Properties": {"Name": _stack_sub(key, "alb"), **_ALB_PROPERTIES}
         }
         
         return {alb_name: config}
     
-    def _generate_ecs_service(self, key: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_ecs_service(self, key: str, analysis: Dict[str, Any], ctx: _GenerationContext) -> Dict[str, Any]:
         """Generate ECS service configuration."""
-        cluster_name = f"{key.title()}Cluster"
-        service_name = f"{key.title()}Service"
-        task_def_name = f"{key.title()}TaskDefinition"
+        prefix = key.title()
+        cluster_name = f"{prefix}Cluster"
+        service_name = f"{prefix}Service"
+        task_def_name = f"{prefix}TaskDefinition"
         
         cluster_config = {
             "Type": "AWS::ECS::Cluster",
             "Properties": {
-                "ClusterName": {"Fn::Sub": f"${{AWS::StackName}}-{key}-cluster"}
+                "ClusterName": _stack_sub(key, "cluster")
             }
         }
         
         task_def_config = {
             "Type": "AWS::ECS::TaskDefinition",
             "Properties": {
-                "Family": {"Fn::Sub": f"${{AWS::StackName}}-{key}-task"},
+                "Family": _stack_sub(key, "task"),
                 "NetworkMode": "awsvpc",
                 "RequiresCompatibilities": ["FARGATE"],
                 "Cpu": "256",
@@ -536,7 +621,7 @@ class ResourceGenerator:
             task_def_name: task_def_config
         }
     
-    def _generate_cloudfront(self, key: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_cloudfront(self, key: str, analysis: Dict[str, Any], ctx: _GenerationContext) -> Dict[str, Any]:
         """Generate CloudFront distribution configuration."""
         cf_name = f"{key.title()}Distribution"
         
@@ -564,63 +649,58 @@ class ResourceGenerator:
         
         return {cf_name: config}
     
-    def _generate_kinesis_stream(self, key: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_kinesis_stream(self, key: str, analysis: Dict[str, Any], ctx: _GenerationContext) -> Dict[str, Any]:
         """Generate Kinesis stream configuration."""
         stream_name = f"{key.title()}Stream"
         
         # Determine performance tier
-        perf_tier = analysis.get('scale_requirements', {}).get('performance_tier', 'standard')
-        
-        # Get shard count and retention period from configuration
-        shard_count = self.config.get_resource_config('kinesis', perf_tier, 'shard_counts', 1)
-        retention_hours = self.config.get_resource_config('kinesis', perf_tier, 'retention_hours', 24)
-        
-        # Adjust shard count based on description if it mentions high throughput
-        description = analysis.get('original_description', '').lower()
-        if 'high throughput' in description or 'high volume' in description:
-            shard_count = max(shard_count * 2, 5)  # Double the shard count or use at least 5
+        perf_tier = ctx.performance_tier
         
+        # Use on-demand mode for high tier or if mentioned in description
+        keywords = ctx.keywords
+        on_demand = perf_tier == 'high' or 'on demand' in keywords or 'auto scaling' in keywords
+        
+        resource_config = self._resource_config
+        properties = {"Name": _stack_sub(key, "stream")}
+        
+        # Provisioned streams need a shard count; on-demand streams must not set one
+        if not on_demand:
+            shard_count = resource_config('kinesis', perf_tier, 'shard_counts', 1)
+            # Adjust shard count based on description if it mentions high throughput
+            if 'high throughput' in keywords or 'high volume' in keywords:
+                shard_count = max(shard_count * 2, 5)  # Double the shard count or use at least 5
+            properties["ShardCount"] = shard_count
+        
+        properties["RetentionPeriodHours"] = resource_config('kinesis', perf_tier, 'retention_hours', 24)
+        properties["StreamModeDetails"] = {
+            "StreamMode": "ON_DEMAND" if on_demand else "PROVISIONED"
+        }
         config = {
             "Type": "AWS::Kinesis::Stream",
-            "Properties": {
-                "Name": {"Fn::Sub": f"${{AWS::StackName}}-{key}-stream"},
-                "ShardCount": shard_count,
-                "RetentionPeriodHours": retention_hours,
-                "StreamModeDetails": {
-                    "StreamMode": "PROVISIONED"
-                }
-            }
+            "Properties": properties
         }
         
-        # Use on-demand mode for high tier or if mentioned in description
-        if perf_tier == 'high' or 'on demand' in description or 'auto scaling' in description:
-            config["Properties"]["StreamModeDetails"] = {
-                "StreamMode": "ON_DEMAND"
-            }
-            # Remove shard count for on-demand mode
-            if "ShardCount" in config["Properties"]:
-                del config["Properties"]["ShardCount"]
-        
         # Add encryption for all but basic tier
-        if analysis.get('security_requirements', {}).get('encryption') or perf_tier != 'basic':
-            config["Properties"]["StreamEncryption"] = {
+        if ctx.encryption or perf_tier != 'basic':
+            properties["StreamEncryption"] = {
                 "EncryptionType": "KMS",
                 "KeyId": "alias/aws/kinesis"
             }
         
         return {stream_name: config}
     
-    def _generate_vpc_resources(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_vpc_resources(self, analysis: Dict[str, Any], ctx: _GenerationContext) -> Dict[str, Any]:
         """Generate VPC and related networking resources."""
         # Get VPC CIDR from configuration
-        vpc_cidr = self.config.get_config('networking.vpc_cidr', '10.0.0.0/16')
+        config_value = self._config_value
+        vpc_cidr = config_value('networking.vpc_cidr', '10.0.0.0/16')
         
         # Get subnet CIDRs from configuration
-        subnet_cidrs = self.config.get_config('networking.subnet_cidrs', ['10.0.1.0/24', '10.0.2.0/24', '10.0.3.0/24'])
+        subnet_cidrs = config_value('networking.subnet_cidrs', ('10.0.1.0/24', '10.0.2.0/24', '10.0.3.0/24'))
         
         # Determine how many subnets to create based on availability requirements
-        high_availability = analysis.get('scale_requirements', {}).get('high_availability', False)
-        multi_az = high_availability or analysis.get('scale_requirements', {}).get('multi_az', False)
+        high_availability = ctx.high_availability
+        multi_az = high_availability or ctx.multi_az
         
         # For high availability, create at least 2 subnets in different AZs
         subnet_count = min(3 if multi_az else 1, len(subnet_cidrs))
@@ -667,31 +747,34 @@ class ResourceGenerator:
             }
         }
         
-        # Create multiple subnets for high availability
-        for i in range(subnet_count):
-            subnet_name = f"PublicSubnet{i+1}" if i > 0 else "PublicSubnet"
-            resources[subnet_name] = {
+        # Create multiple subnets for high availability, each with a route table association
+        subnet_names = [f"PublicSubnet{i + 1}" if i else "PublicSubnet" for i in range(subnet_count)]
+        resources.update({
+            subnet_name: {
                 "Type": "AWS::EC2::Subnet",
                 "Properties": {
                     "VpcId": {"Ref": "VPC"},
                     "CidrBlock": subnet_cidrs[i],
                     "AvailabilityZone": {"Fn::Select": [i, {"Fn::GetAZs": ""}]},
                     "MapPublicIpOnLaunch": True,
-                    "Tags": [{"Key": "Name", "Value": {"Fn::Sub": f"${{AWS::StackName}}-public-subnet-{i+1}"}}]
+                    "Tags": [{"Key": "Name", "Value": {"Fn::Sub": f"${{AWS::StackName}}-public-subnet-{i + 1}"}}]
                 }
             }
-            
-            # Create route table association for each subnet
-            resources[f"RouteTableAssociation{i+1}"] = {
+            for i, subnet_name in enumerate(subnet_names)
+        })
+        resources.update({
+            f"RouteTableAssociation{i + 1}": {
                 "Type": "AWS::EC2::SubnetRouteTableAssociation",
                 "Properties": {
                     "SubnetId": {"Ref": subnet_name},
                     "RouteTableId": {"Ref": "RouteTable"}
                 }
             }
+            for i, subnet_name in enumerate(subnet_names)
+        })
         
         # Add NAT Gateway for private subnets if high availability is required
-        if high_availability and 'private' in analysis.get('original_description', '').lower():
+        if high_availability and 'private' in ctx.keywords:
             resources["ElasticIP"] = {
                 "Type": "AWS::EC2::EIP",
                 "DependsOn": "AttachGateway",
@@ -747,12 +830,12 @@ class ResourceGenerator:
         
         return resources
     
-    def _generate_iam_resources(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_iam_resources(self, analysis: Dict[str, Any], ctx: _GenerationContext) -> Dict[str, Any]:
         """Generate common IAM resources."""
         resources = {}
         
         # Add database password parameter if RDS is present
-        if any('rds' in key.lower() for key in analysis.get('resources', {})):
+        if 'AWS::RDS::DBInstance' in ctx.resource_types:
             resources["DatabasePassword"] = {
                 "Type": "AWS::SSM::Parameter::Value<String>",
                 "Default": "/myapp/database/password",
@@ -761,3 +844,17 @@ class ResourceGenerator:
             }
         
         return resources
+
+    # Resource type -> generator, looked up once per resource in generate_resources
+    _GENERATORS = {
+        'AWS::S3::Bucket': _generate_s3_bucket,
+        'AWS::Lambda::Function': _generate_lambda_function,
+        'AWS::DynamoDB::Table': _generate_dynamodb_table,
+        'AWS::ApiGateway::RestApi': _generate_api_gateway,
+        'AWS::EC2::Instance': _generate_ec2_instance,
+        'AWS::RDS::DBInstance': _generate_rds_instance,
+        'AWS::ElasticLoadBalancingV2::LoadBalancer': _generate_load_balancer,
+        'AWS::ECS::Service': _generate_ecs_service,
+        'AWS::CloudFront::Distribution': _generate_cloudfront,
+        'AWS::Kinesis::Stream': _generate_kinesis_stream,
+    }
@@ -1,9 +1,12 @@
 """Resource mapping for CloudFormation template generation."""
 
-from typing import Dict, List, Any, Set
+from collections import Counter
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Any, Set, Tuple
 
 # Comprehensive mapping of common terms to AWS resource types
-RESOURCE_MAPPING = {
+RESOURCE_MAPPING = MappingProxyType({
     # Compute
     "ec2": "AWS::EC2::Instance",
     "instance": "AWS::EC2::Instance",
@@ -91,68 +94,104 @@ RESOURCE_MAPPING = {
     "kinesis": "AWS::Kinesis::Stream",
     "stream": "AWS::Kinesis::Stream",
     "firehose": "AWS::KinesisFirehose::DeliveryStream"
-}
+})
 
 # Architecture patterns with required components
-ARCHITECTURE_PATTERNS = {
-    "web application": {
-        "components": [
+ARCHITECTURE_PATTERNS = MappingProxyType({
+    "web application": MappingProxyType({
+        "components": (
             "AWS::ElasticLoadBalancingV2::LoadBalancer",
             "AWS::EC2::Instance",
             "AWS::EC2::SecurityGroup",
             "AWS::EC2::VPC"
-        ],
-        "optional": [
+        ),
+        "optional": (
             "AWS::RDS::DBInstance",
             "AWS::ElastiCache::CacheCluster"
-        ]
-    },
-    "serverless api": {
-        "components": [
+        )
+    }),
+    "serverless api": MappingProxyType({
+        "components": (
             "AWS::ApiGateway::RestApi",
             "AWS::Lambda::Function",
             "AWS::IAM::Role"
-        ],
-        "optional": [
+        ),
+        "optional": (
             "AWS::DynamoDB::Table",
             "AWS::S3::Bucket"
-        ]
-    },
-    "microservices": {
-        "components": [
+        )
+    }),
+    "microservices": MappingProxyType({
+        "components": (
             "AWS::ECS::Service",
             "AWS::ECS::Cluster",
             "AWS::ElasticLoadBalancingV2::LoadBalancer",
             "AWS::EC2::VPC"
-        ],
-        "optional": [
+        ),
+        "optional": (
             "AWS::RDS::DBInstance",
             "AWS::ElastiCache::CacheCluster"
-        ]
-    },
-    "data pipeline": {
-        "components": [
+        )
+    }),
+    "data pipeline": MappingProxyType({
+        "components": (
             "AWS::S3::Bucket",
             "AWS::Lambda::Function",
             "AWS::IAM::Role"
-        ],
-        "optional": [
+        ),
+        "optional": (
             "AWS::Kinesis::Stream",
             "AWS::Glue::Job"
-        ]
-    },
-    "static website": {
-        "components": [
+        )
+    }),
+    "static website": MappingProxyType({
+        "components": (
             "AWS::S3::Bucket",
             "AWS::CloudFront::Distribution"
-        ],
-        "optional": [
+        ),
+        "optional": (
             "AWS::Route53::RecordSet",
             "AWS::CertificateManager::Certificate"
-        ]
+        )
+    })
+})
+
+# Logical-name prefix for each mapped or pattern resource type, e.g. "Bucket" for AWS::S3::Bucket
+_BASE_NAMES = {
+    resource_type: resource_type.split('::')[-1]
+    for resource_type in {
+        *RESOURCE_MAPPING.values(),
+        *(component for pattern in ARCHITECTURE_PATTERNS.values() for component in pattern["components"]),
     }
 }
 
+
+def _numbered_components(component_types: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    """Name components by prefix, numbering each from 1, e.g. ("Function1", "AWS::Lambda::Function")."""
+    name_counts = Counter()
+    components = []
+    for component_type in component_types:
+        base_name = _BASE_NAMES[component_type]
+        name_counts[base_name] += 1
+        components.append((f"{base_name}{name_counts[base_name]}", component_type))
+    return tuple(components)
+
+
+# Numbered (name, type) pairs for each architecture pattern's components
+_PATTERN_EXPANSIONS = {
+    pattern_name: _numbered_components(pattern["components"])
+    for pattern_name, pattern in ARCHITECTURE_PATTERNS.items()
+}
+
+# Resource types that must be deployed into a VPC
+_VPC_DEPENDENT_TYPES = frozenset({
+    "AWS::EC2::Instance",
+    "AWS::RDS::DBInstance",
+    "AWS::ElasticLoadBalancingV2::LoadBalancer",
+    "AWS::ECS::Service"
+})
+
+
 def identify_resources_from_description(description: str) -> Dict[str, str]:
     """Identify AWS resources from a natural language description.
     
@@ -162,43 +201,38 @@ def identify_resources_from_description(description: str) -> Dict[str, str]:
     Returns:
         Dictionary mapping resource names to AWS resource types
     """
-    description_lower = description.lower()
+    return dict(_identify_resources(description.lower()))
+
+
+@lru_cache(maxsize=512)
+def _identify_resources(description_lower: str) -> Tuple[Tuple[str, str], ...]:
+    """Resource (name, type) pairs for a lowercased description, cached per text."""
     identified_resources = {}
     
-    # First, try to identify architecture patterns
-    architecture = None
-    for pattern_name in ARCHITECTURE_PATTERNS:
-        if pattern_name in description_lower:
-            architecture = pattern_name
-            break
+    # First, try to identify architecture patterns; the first declared match wins
+    architecture = next(
+        (pattern_name for pattern_name in ARCHITECTURE_PATTERNS if pattern_name in description_lower),
+        None,
+    )
     
     # If an architecture pattern is identified, add its components
     if architecture:
-        components = ARCHITECTURE_PATTERNS[architecture]["components"]
-        for i, component_type in enumerate(components):
-            resource_name = f"{component_type.split('::')[-1]}{i+1}"
-            identified_resources[resource_name] = component_type
+        identified_resources.update(_PATTERN_EXPANSIONS[architecture])
     
-    # Then look for specific resources
+    # Then look for specific resources, numbering each name prefix after those already present.
+    # Types can share a prefix (AWS::ECS::Cluster, AWS::EKS::Cluster), so counts are per prefix.
+    name_counts = Counter(_BASE_NAMES[resource_type] for resource_type in identified_resources.values())
     for term, resource_type in RESOURCE_MAPPING.items():
         if term in description_lower:
-            # Generate a unique name for this resource type
-            base_name = resource_type.split('::')[-1]
-            count = 1
-            resource_name = f"{base_name}{count}"
-            
-            # Ensure we don't duplicate resource types from the architecture pattern
-            while resource_name in identified_resources and identified_resources[resource_name] == resource_type:
-                count += 1
-                resource_name = f"{base_name}{count}"
-            
-            identified_resources[resource_name] = resource_type
+            base_name = _BASE_NAMES[resource_type]
+            name_counts[base_name] += 1
+            identified_resources[f"{base_name}{name_counts[base_name]}"] = resource_type
     
     # Ensure we have at least one resource
     if not identified_resources:
         identified_resources["DefaultBucket"] = "AWS::S3::Bucket"
     
-    return identified_resources
+    return tuple(identified_resources.items())
 
 
 def get_related_resources(resources: Dict[str, str]) -> Dict[str, str]:
@@ -210,8 +244,13 @@ def get_related_resources(resources: Dict[str, str]) -> Dict[str, str]:
     Returns:
         Dictionary of additional related resources
     """
+    return dict(_related_resources(frozenset(resources.values())))
+
+
+@lru_cache(maxsize=256)
+def _related_resources(resource_types: FrozenSet[str]) -> Tuple[Tuple[str, str], ...]:
+    """Related resource (name, type) pairs for a set of resource types, cached per set."""
     related_resources = {}
-    resource_types = set(resources.values())
     
     # Add IAM roles for Lambda functions
     if "AWS::Lambda::Function" in resource_types:
@@ -222,14 +261,7 @@ def get_related_resources(resources: Dict[str, str]) -> Dict[str, str]:
         related_resources["InstanceSecurityGroup"] = "AWS::EC2::SecurityGroup"
     
     # Add VPC for resources that require it
-    vpc_dependent_resources = [
-        "AWS::EC2::Instance", 
-        "AWS::RDS::DBInstance", 
-        "AWS::ElasticLoadBalancingV2::LoadBalancer",
-        "AWS::ECS::Service"
-    ]
-    
-    if any(res in resource_types for res in vpc_dependent_resources) and "AWS::EC2::VPC" not in resource_types:
+    if not resource_types.isdisjoint(_VPC_DEPENDENT_TYPES) and "AWS::EC2::VPC" not in resource_types:
         related_resources["VPC"] = "AWS::EC2::VPC"
         related_resources["Subnet1"] = "AWS::EC2::Subnet"
         related_resources["Subnet2"] = "AWS::EC2::Subnet"
@@ -242,4 +274,4 @@ def get_related_resources(resources: Dict[str, str]) -> Dict[str, str]:
     if "AWS::ElasticLoadBalancingV2::LoadBalancer" in resource_types:
         related_resources["TargetGroup"] = "AWS::ElasticLoadBalancingV2::TargetGroup"
     
-    return related_resources
\ No newline at end of file
+    return tuple(related_resources.items())
@@ -1,6 +1,9 @@
 """Resource operations for AWS CloudFormation resources."""
 
-from typing import Dict, Any, List
+import asyncio
+import contextlib
+import json
+from typing import Dict, Any, Iterator, List
 from awslabs.cfn_mcp_server.aws_client import get_aws_client, get_actual_region
 from awslabs.cfn_mcp_server.cloud_control_utils import progress_event, validate_patch
 from awslabs.cfn_mcp_server.errors import ClientError, handle_aws_api_error
@@ -8,13 +11,28 @@ from awslabs.cfn_mcp_server.schema_manager import schema_manager
 from awslabs.cfn_mcp_server.input_validator import InputValidator, ValidationError
 
 
+# Concurrent Cloud Control calls per batch, well within the client's connection pool
+MAX_CONCURRENT_REQUESTS = 25
+
+
+@contextlib.contextmanager
+def _aws_errors() -> Iterator[None]:
+    """Translate validation failures and AWS API errors raised in the block."""
+    try:
+        yield
+    except ValidationError as e:
+        raise ClientError(str(e))
+    except Exception as e:
+        raise handle_aws_api_error(e)
+
+
 class ResourceOperations:
     """Handles AWS resource CRUD operations."""
     
     @staticmethod
     async def get_resource_schema(resource_type: str, region: str = None) -> Dict[str, Any]:
         """Get schema information for an AWS resource type."""
-        try:
+        with _aws_errors():
             # Validate inputs
             resource_type = InputValidator.validate_aws_resource_type(resource_type)
             region = InputValidator.validate_aws_region(region)
@@ -22,17 +40,16 @@ class ResourceOperations:
             region = get_actual_region(region)
             sm = schema_manager()
             return await sm.get_schema(resource_type, region)
-        except ValidationError as e:
-            raise ClientError(str(e))
-        except Exception as e:
-            raise handle_aws_api_error(e)
-            print(f"DEBUG: Exception in get_resource_schema: {e}")
-            raise handle_aws_api_error(e)
     
     @staticmethod
     def list_resources(resource_type: str, region: str = None) -> List[str]:
         """List AWS resources of a specified type."""
-        try:
+        return list(ResourceOperations.iter_resources(resource_type, region))
+    
+    @staticmethod
+    def iter_resources(resource_type: str, region: str = None) -> Iterator[str]:
+        """Yield identifiers of AWS resources of a specified type, one page at a time."""
+        with _aws_errors():
             # Validate inputs
             resource_type = InputValidator.validate_aws_resource_type(resource_type)
             region = InputValidator.validate_aws_region(region)
@@ -40,43 +57,43 @@ class ResourceOperations:
             region = get_actual_region(region)
             client = get_aws_client('cloudcontrol', region)
             
-            paginator = client.get_paginator('list_resources')
-            page_iterator = paginator.paginate(TypeName=resource_type)
-            
-            identifiers = []
-            for page in page_iterator:
-                for resource in page.get('ResourceDescriptions', []):
-                    identifiers.append(resource['Identifier'])
-            
-            return identifiers
-        except ValidationError as e:
-            raise ClientError(str(e))
-        except Exception as e:
-            raise handle_aws_api_error(e)
+            yield from ResourceOperations._iter_identifiers(client, resource_type)
+    
+    @staticmethod
+    def _iter_identifiers(client: Any, resource_type: str) -> Iterator[str]:
+        """Page through resource identifiers with an existing Cloud Control client."""
+        paginator = client.get_paginator('list_resources')
+        pages = paginator.paginate(TypeName=resource_type, PaginationConfig={'PageSize': 100})
+        for page in pages:
+            for resource in page.get('ResourceDescriptions', ()):
+                yield resource['Identifier']
     
     @staticmethod
     def get_resource(resource_type: str, identifier: str, region: str = None) -> Dict[str, Any]:
         """Get details of a specific AWS resource."""
-        try:
+        with _aws_errors():
             region = get_actual_region(region)
             client = get_aws_client('cloudcontrol', region)
             
-            response = client.get_resource(
-                TypeName=resource_type,
-                Identifier=identifier
-            )
-            
-            return {
-                "identifier": identifier,
-                "properties": response['ResourceDescription']['Properties']
-            }
-        except Exception as e:
-            raise handle_aws_api_error(e)
+            return ResourceOperations._describe_resource(client, resource_type, identifier)
+    
+    @staticmethod
+    def _describe_resource(client: Any, resource_type: str, identifier: str) -> Dict[str, Any]:
+        """Fetch one resource with an existing Cloud Control client."""
+        response = client.get_resource(
+            TypeName=resource_type,
+            Identifier=identifier
+        )
+        
+        return {
+            "identifier": identifier,
+            "properties": response['ResourceDescription']['Properties']
+        }
     
     @staticmethod
     def create_resource(resource_type: str, properties: Dict[str, Any], region: str = None) -> Dict[str, Any]:
         """Create an AWS resource."""
-        try:
+        with _aws_errors():
             # Validate inputs
             resource_type = InputValidator.validate_aws_resource_type(resource_type)
             properties = InputValidator.validate_properties(properties)
@@ -87,19 +104,15 @@ class ResourceOperations:
             
             response = client.create_resource(
                 TypeName=resource_type,
-                DesiredState=str(properties)
+                DesiredState=json.dumps(properties, separators=(',', ':'))
             )
             
-            return progress_event(response['ProgressEvent'])
-        except ValidationError as e:
-            raise ClientError(str(e))
-        except Exception as e:
-            raise handle_aws_api_error(e)
+            return progress_event(response['ProgressEvent'], response.get('HooksProgressEvent'))
     
     @staticmethod
     def update_resource(resource_type: str, identifier: str, patch_document: List[Dict[str, Any]], region: str = None) -> Dict[str, Any]:
         """Update an AWS resource."""
-        try:
+        with _aws_errors():
             region = get_actual_region(region)
             
             # Validate patch document
@@ -111,17 +124,15 @@ class ResourceOperations:
             response = client.update_resource(
                 TypeName=resource_type,
                 Identifier=identifier,
-                PatchDocument=str(patch_document) if patch_document else None
+                PatchDocument=json.dumps(patch_document, separators=(',', ':')) if patch_document else None
             )
             
-            return progress_event(response['ProgressEvent'])
-        except Exception as e:
-            raise handle_aws_api_error(e)
+            return progress_event(response['ProgressEvent'], response.get('HooksProgressEvent'))
     
     @staticmethod
     def delete_resource(resource_type: str, identifier: str, region: str = None) -> Dict[str, Any]:
         """Delete an AWS resource."""
-        try:
+        with _aws_errors():
             region = get_actual_region(region)
             client = get_aws_client('cloudcontrol', region)
             
@@ -130,14 +141,143 @@ class ResourceOperations:
                 Identifier=identifier
             )
             
-            return progress_event(response['ProgressEvent'])
-        except Exception as e:
-            raise handle_aws_api_error(e)
+            return progress_event(response['ProgressEvent'], response.get('HooksProgressEvent'))
+    
+    # Cloud Control calls block on network I/O; these run them on a worker thread so
+    # async callers can await several operations concurrently with asyncio.gather.
+    # Clients are still created on the calling thread: the shared boto3 session is
+    # not thread-safe, so only the API call itself goes to the worker.
+    @staticmethod
+    async def list_resources_async(resource_type: str, region: str = None) -> List[str]:
+        """List AWS resources of a specified type without blocking the event loop."""
+        with _aws_errors():
+            # Validate inputs
+            resource_type = InputValidator.validate_aws_resource_type(resource_type)
+            region = InputValidator.validate_aws_region(region)
+            
+            region = get_actual_region(region)
+            client = get_aws_client('cloudcontrol', region)
+            
+            return await asyncio.to_thread(
+                list, ResourceOperations._iter_identifiers(client, resource_type)
+            )
+    
+    @staticmethod
+    async def get_resource_async(resource_type: str, identifier: str, region: str = None) -> Dict[str, Any]:
+        """Get details of a specific AWS resource without blocking the event loop."""
+        with _aws_errors():
+            region = get_actual_region(region)
+            client = get_aws_client('cloudcontrol', region)
+            
+            return await asyncio.to_thread(
+                ResourceOperations._describe_resource, client, resource_type, identifier
+            )
+    
+    @staticmethod
+    async def get_resources_async(resource_type: str, identifiers: List[str], region: str = None) -> List[Dict[str, Any]]:
+        """Get details of several AWS resources concurrently, in the order of the identifiers.
+        
+        A resource that cannot be fetched gets an entry with an "error" message in
+        place of its properties, so one failure does not discard the other results.
+        """
+        with _aws_errors():
+            # Validate inputs
+            resource_type = InputValidator.validate_aws_resource_type(resource_type)
+            region = InputValidator.validate_aws_region(region)
+            if not isinstance(identifiers, list):
+                raise ValidationError("Identifiers must be a list")
+            identifiers = [InputValidator.validate_identifier(i) for i in identifiers]
+            
+            # Create the client here, once, rather than from every worker thread at once
+            region = get_actual_region(region)
+            client = get_aws_client('cloudcontrol', region)
+        
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        async def get_one(identifier: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(
+                        ResourceOperations._describe_resource, client, resource_type, identifier
+                    )
+                except Exception as e:
+                    return {"identifier": identifier, "error": str(handle_aws_api_error(e))}
+        
+        return await asyncio.gather(*map(get_one, identifiers))
+    
+    @staticmethod
+    async def create_resource_async(resource_type: str, properties: Dict[str, Any], region: str = None) -> Dict[str, Any]:
+        """Create an AWS resource without blocking the event loop."""
+        with _aws_errors():
+            # Validate inputs
+            resource_type = InputValidator.validate_aws_resource_type(resource_type)
+            properties = InputValidator.validate_properties(properties)
+            region = InputValidator.validate_aws_region(region)
+            
+            region = get_actual_region(region)
+            client = get_aws_client('cloudcontrol', region)
+            
+            response = await asyncio.to_thread(
+                client.create_resource,
+                TypeName=resource_type,
+                DesiredState=json.dumps(properties, separators=(',', ':'))
+            )
+            
+            return progress_event(response['ProgressEvent'], response.get('HooksProgressEvent'))
+    
+    @staticmethod
+    async def update_resource_async(resource_type: str, identifier: str, patch_document: List[Dict[str, Any]], region: str = None) -> Dict[str, Any]:
+        """Update an AWS resource without blocking the event loop."""
+        with _aws_errors():
+            region = get_actual_region(region)
+            
+            # Validate patch document
+            if patch_document:
+                validate_patch(patch_document)
+            
+            client = get_aws_client('cloudcontrol', region)
+            
+            response = await asyncio.to_thread(
+                client.update_resource,
+                TypeName=resource_type,
+                Identifier=identifier,
+                PatchDocument=json.dumps(patch_document, separators=(',', ':')) if patch_document else None
+            )
+            
+            return progress_event(response['ProgressEvent'], response.get('HooksProgressEvent'))
+    
+    @staticmethod
+    async def delete_resource_async(resource_type: str, identifier: str, region: str = None) -> Dict[str, Any]:
+        """Delete an AWS resource without blocking the event loop."""
+        with _aws_errors():
+            region = get_actual_region(region)
+            client = get_aws_client('cloudcontrol', region)
+            
+            response = await asyncio.to_thread(
+                client.delete_resource,
+                TypeName=resource_type,
+                Identifier=identifier
+            )
+            
+            return progress_event(response['ProgressEvent'], response.get('HooksProgressEvent'))
+    
+    @staticmethod
+    async def get_resource_request_status_async(request_token: str, region: str = None) -> Dict[str, Any]:
+        """Get the status of a long running operation without blocking the event loop."""
+        with _aws_errors():
+            region = get_actual_region(region)
+            client = get_aws_client('cloudcontrol', region)
+            
+            response = await asyncio.to_thread(
+                client.get_resource_request_status, RequestToken=request_token
+            )
+            
+            return progress_event(response['ProgressEvent'], response.get('HooksProgressEvent'))
     
     @staticmethod
     def get_resource_request_status(request_token: str, region: str = None) -> Dict[str, Any]:
         """Get the status of a long running operation."""
-        try:
+        with _aws_errors():
             region = get_actual_region(region)
             client = get_aws_client('cloudcontrol', region)
             
@@ -145,6 +285,4 @@ class ResourceOperations:
                 RequestToken=request_token
             )
             
-            return progress_event(response['ProgressEvent'])
-        except Exception as e:
-            raise handle_aws_api_error(e)
+            return progress_event(response['ProgressEvent'], response.get('HooksProgressEvent'))
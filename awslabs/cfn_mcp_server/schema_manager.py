@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import json
+import logging
 import os
 from awslabs.cfn_mcp_server.aws_client import get_aws_client
 from awslabs.cfn_mcp_server.errors import ClientError
@@ -21,6 +22,8 @@ from pathlib import Path
 from typing import Dict
 
 
+logger = logging.getLogger(__name__)
+
 # all schema metadata is stored in .schemas/schema_metadata.json. The schemas themselves are all stored in the directory.
 SCHEMA_CACHE_DIR = '.schemas'
 SCHEMA_METADATA_FILE = 'schema_metadata.json'
@@ -30,11 +33,12 @@ SCHEMA_UPDATE_INTERVAL = timedelta(days=7)  # Check for updates weekly
 class SchemaManager:
     """Responsible for keeping track of schemas, cacheing them locally, and updating them if they are outdated."""
 
-    def __init__(self):
-        """Initialize the schema manager with the cache directory."""
+    def __init__(self, cache_dir: str | os.PathLike | None = None):
+        """Initialize the schema manager with the cache directory (the package's .schemas by default)."""
         self._initialized = False
         try:
-            cache_dir = os.path.join(os.path.dirname(__file__), '.schemas')
+            if cache_dir is None:
+                cache_dir = os.path.join(os.path.dirname(__file__), SCHEMA_CACHE_DIR)
             self.cache_dir = Path(cache_dir)
             self.metadata_file = self.cache_dir / SCHEMA_METADATA_FILE
             self.schema_registry: Dict[str, dict] = {}
@@ -44,6 +48,9 @@ class SchemaManager:
 
             # Load metadata if it exists
             self.metadata = self._load_metadata()
+
+            # Load cached schemas into registry
+            self._load_cached_schemas()
             
             self._initialized = True
         except Exception as e:
@@ -54,9 +61,6 @@ class SchemaManager:
         """Check if the schema manager is properly initialized."""
         return getattr(self, '_initialized', False)
 
-        # Load cached schemas into registry
-        self._load_cached_schemas()
-
     def _load_metadata(self) -> dict:
         """Load schema metadata from file or create if it doesn't exist."""
         if self.metadata_file.exists():
@@ -64,7 +68,7 @@ class SchemaManager:
                 with open(self.metadata_file, 'r') as f:
                     return json.load(f)
             except json.JSONDecodeError:
-                print('Corrupted metadata file. Creating new one.')
+                logger.warning('Corrupted metadata file. Creating new one.')
 
         # Default metadata
         metadata = {'version': '1', 'schemas': {}}
@@ -87,9 +91,9 @@ class SchemaManager:
                     if 'typeName' in schema:
                         resource_type = schema['typeName']
                         self.schema_registry[resource_type] = schema
-                        print(f'Loaded schema for {resource_type} from cache')
+                        logger.debug(f'Loaded schema for {resource_type} from cache')
             except (json.JSONDecodeError, IOError) as e:
-                print(f'Error loading schema from {schema_file}: {str(e)}')
+                logger.warning(f'Error loading schema from {schema_file}: {str(e)}')
 
     async def get_schema(self, resource_type: str, region: str | None = None) -> dict:
         """Get schema for a resource type, downloading it if necessary."""
@@ -107,11 +111,11 @@ class SchemaManager:
                             # Schema is recent enough, use cached version
                             return self.schema_registry[resource_type]
                         else:
-                            print(
+                            logger.info(
                                 f'Schema for {resource_type} is older than {SCHEMA_UPDATE_INTERVAL.days} days, refreshing...'
                             )
                     except ValueError:
-                        print(f'Invalid timestamp format for {resource_type}: {last_updated_str}')
+                        logger.warning(f'Invalid timestamp format for {resource_type}: {last_updated_str}')
             else:
                 # No metadata for this schema, use cached version
                 return self.schema_registry[resource_type]
@@ -141,11 +145,12 @@ class SchemaManager:
 
         # If no local spec file or it failed to load, try CloudFormation API
         try:
-            print(f'Downloading schema for {resource_type} using CloudFormation API')
+            logger.info(f'Downloading schema for {resource_type} using CloudFormation API')
             cfn_client = get_aws_client('cloudformation', region)
             resp = cfn_client.describe_type(Type='RESOURCE', TypeName=resource_type)
             schema_str = resp['Schema']
             spec = json.loads(schema_str)
+            self.schema_registry[resource_type] = spec
 
             # Save schema to cache
             schema_file = self.cache_dir / f'{resource_type.replace("::", "_")}.json'
@@ -162,7 +167,7 @@ class SchemaManager:
             with open(self.metadata_file, 'w') as f:
                 json.dump(self.metadata, f, indent=2)
 
-            print(f'Processed and cached schema for {resource_type}')
+            logger.info(f'Processed and cached schema for {resource_type}')
             return spec
         except Exception as e:
             raise ClientError(f'Error downloading the schema for {resource_type}: {str(e)}')
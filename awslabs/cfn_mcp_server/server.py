@@ -18,6 +18,7 @@ import argparse
 import json
 import time
 import yaml
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 import botocore.exceptions
 from awslabs.cfn_mcp_server.resource_operations import ResourceOperations
@@ -92,7 +93,7 @@ async def list_resources(
     Returns:
         A list of resource identifiers
     """
-    return ResourceOperations.list_resources(resource_type, region)
+    return await ResourceOperations.list_resources_async(resource_type, region)
 
 
 @mcp.tool()
@@ -121,7 +122,46 @@ async def get_resource(
             "properties": The detailed information about the resource
         }
     """
-    return ResourceOperations.get_resource(resource_type, identifier, region)
+    return await ResourceOperations.get_resource_async(resource_type, identifier, region)
+
+
+@mcp.tool()
+async def get_resources(
+    resource_type: str = Field(
+        description='The AWS resource type (e.g., "AWS::S3::Bucket", "AWS::RDS::DBInstance")'
+    ),
+    identifiers: List[str] = Field(
+        description='The primary identifiers of the resources to get (e.g., bucket names for S3 buckets)'
+    ),
+    region: str | None = Field(
+        description='The AWS region that the operation should be performed in', default=None
+    ),
+) -> list:
+    """Get details of several AWS resources of one type in a single call.
+
+    Resources are fetched concurrently, a bounded number at a time. A resource that
+    cannot be fetched (e.g. not found or access denied) does not fail the call; its
+    entry carries an "error" message instead of "properties".
+
+    Parameters:
+        resource_type: The AWS resource type (e.g., "AWS::S3::Bucket")
+        identifiers: The primary identifiers of the resources to get
+        region: AWS region to use (e.g., "us-east-1", "us-west-2")
+
+    Returns:
+        A list in the same order as the identifiers, each entry with the structure
+        returned by get_resource:
+        {
+            "identifier": The resource identifier,
+            "properties": The detailed information about the resource
+        }
+        or, for a resource that could not be fetched:
+        {
+            "identifier": The resource identifier,
+            "error": Why the resource could not be fetched
+        }
+    """
+    return await ResourceOperations.get_resources_async(resource_type, identifiers, region)
 
 
 @mcp.tool()
@@ -168,7 +208,7 @@ async def update_resource(
     if not patch_document:
         raise ClientError('Please provide a patch document for the update')
 
-    return ResourceOperations.update_resource(resource_type, identifier, patch_document, region)
+    return await ResourceOperations.update_resource_async(resource_type, identifier, patch_document, region)
 
 
 @mcp.tool()
@@ -200,7 +240,7 @@ async def create_resource(
             "resource_info": Optional information about the resource properties
         }
     """
-    return ResourceOperations.create_resource(resource_type, properties, region)
+    return await ResourceOperations.create_resource_async(resource_type, properties, region)
 
 
 @mcp.tool()
@@ -233,7 +273,7 @@ async def delete_resource(
             "request_token": A token that allows you to track long running operations via the get_resource_request_status tool
         }
     """
-    return ResourceOperations.delete_resource(resource_type, identifier, region)
+    return await ResourceOperations.delete_resource_async(resource_type, identifier, region)
 
 
 @mcp.tool()
@@ -264,7 +304,7 @@ async def get_resource_request_status(
             "retry_after": A duration to wait before retrying the request
         }
     """
-    return ResourceOperations.get_resource_request_status(request_token, region)
+    return await ResourceOperations.get_resource_request_status_async(request_token, region)
 
 
 @mcp.tool()
@@ -334,6 +374,24 @@ async def create_template(
     )
 
 
+# The prompt helpers keep no per-request state, so one instance of each serves every call
+@lru_cache(maxsize=None)
+def _template_prompt_tools():
+    """Shared TemplateGenerator and PromptValidator instances."""
+    from awslabs.cfn_mcp_server.template_generator_clean import TemplateGenerator
+    from awslabs.cfn_mcp_server.prompt_validator import PromptValidator
+
+    return TemplateGenerator(), PromptValidator()
+
+
+@lru_cache(maxsize=None)
+def _question_generator():
+    """Shared IntelligentQuestionGenerator instance."""
+    from awslabs.cfn_mcp_server.intelligent_question_generator import IntelligentQuestionGenerator
+
+    return IntelligentQuestionGenerator()
+
+
 @mcp.tool()
 async def generate_cloudformation_template(
     description: str = Field(
@@ -388,24 +446,15 @@ async def generate_cloudformation_template(
     - "Create a microservices platform with service mesh"
     """
     try:
-        from awslabs.cfn_mcp_server.template_generator_clean import TemplateGenerator
-        from awslabs.cfn_mcp_server.prompt_validator import PromptValidator
-        
-        generator = TemplateGenerator()
-        validator = PromptValidator()
+        generator, validator = _template_prompt_tools()
         
-        # Enhanced analysis with new capabilities
+        # Enhanced analysis, including implicit requirements detection
         analysis = generator._analyze_request(description)
         
-        # Add implicit requirements detection
-        implicit_reqs = generator._detect_implicit_requirements(description.lower(), analysis["architecture_type"])
-        analysis["implicit_requirements"] = implicit_reqs
-        
         if conversation_stage == "DISCOVERY":
             # Generate intelligent discovery questions
             try:
-                from .intelligent_question_generator import IntelligentQuestionGenerator
-                question_gen = IntelligentQuestionGenerator()
+                question_gen = _question_generator()
                 
                 discovery_prompt = question_gen.create_discovery_prompt_with_questions(
                     description, analysis
@@ -470,7 +519,7 @@ async def generate_cloudformation_template(
             validation_result = validator.validate_prompt_quality(generation_prompt, analysis)
             
             # Enhance prompt if quality is insufficient
-            if validation_result["quality_level"] in ["NEEDS_IMPROVEMENT", "POOR"]:
+            if validation_result.quality_level in ["NEEDS_IMPROVEMENT", "POOR"]:
                 generation_prompt = validator.enhance_prompt_based_on_validation(
                     generation_prompt, validation_result, analysis
                 )
@@ -479,7 +528,7 @@ async def generate_cloudformation_template(
                 "conversation_stage": "GENERATION",
                 "expert_prompt_for_claude": generation_prompt,
                 "analysis": analysis,
-                "prompt_quality": validation_result,
+                "prompt_quality": validation_result.to_dict(),
                 "final_stage": True,
                 "instructions": "This is the final prompt - please generate the complete CloudFormation template and documentation."
             }
@@ -1312,7 +1361,11 @@ async def generate_template_fixes(
             if template_content.strip().startswith('{'):
                 fixed_template_str = json.dumps(fix_result['fixed_template'], indent=2)
             else:
-                fixed_template_str = yaml.dump(fix_result['fixed_template'], default_flow_style=False)
+                fixed_template_str = yaml.dump(
+                    fix_result['fixed_template'],
+                    Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper),
+                    default_flow_style=False,
+                )
         
         return {
             'success': fix_result.get('success', False),
@@ -28,6 +28,8 @@ Key Focus:
 import re
 from typing import Dict, List, Any, Optional
 
+_WORD_PATTERN = re.compile(r'\b\w+\b')
+
 class TemplateGenerator:
     """
     Enhances basic template requests into comprehensive expert prompts.
@@ -198,7 +200,8 @@ class TemplateGenerator:
             "compliance_requirements": compliance_requirements,
             "scale": scale,
             "environment": environment,
-            "keywords": re.findall(r'\b\w+\b', description_lower)
+            "keywords": _WORD_PATTERN.findall(description_lower),
+            "implicit_requirements": implicit_requirements
         }
     
     def _create_expert_template_prompt(
@@ -30,7 +30,7 @@ class CloudFormationYamlDumper(yaml.SafeDumper):
         """Override to handle CloudFormation intrinsic functions consistently."""
         # Check if this is a CloudFormation intrinsic function
         if len(mapping) == 1:
-            key = list(mapping.keys())[0]
+            key = next(iter(mapping))
             if key in ['Ref', 'Fn::GetAtt', 'Fn::Sub', 'Fn::Join', 'Fn::Select', 'Fn::ImportValue',
                       'Fn::GetAZs', 'Fn::Split', 'Fn::FindInMap', 'Fn::Base64', 'Fn::Cidr',
                       'Fn::Transform', 'Fn::If', 'Fn::Equals', 'Fn::Not', 'Fn::And', 'Fn::Or']:
@@ -14,11 +14,17 @@
 """Tests for the cfn MCP Server."""
 
 import pytest
-from awslabs.cfn_mcp_server.aws_client import get_aws_client
+from awslabs.cfn_mcp_server.aws_client import _cached_client, get_aws_client
 from awslabs.cfn_mcp_server.errors import ClientError
 from unittest.mock import patch
 
 
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Start every test without cached clients."""
+    _cached_client.cache_clear()
+
+
 @pytest.mark.asyncio
 class TestClient:
     """Tests on the aws_client module."""
@@ -75,3 +81,25 @@ class TestClient:
 
         with pytest.raises(ClientError):
             get_aws_client('cloudcontrol')
+
+    @patch('awslabs.cfn_mcp_server.aws_client.session')
+    @patch('awslabs.cfn_mcp_server.aws_client.environ')
+    async def test_client_reused_per_service_and_region(self, mock_environ, mock_session):
+        """Testing clients are created once per service and region."""
+        mock_session.client.side_effect = lambda service, **kwargs: object()
+
+        first = get_aws_client('cloudcontrol', 'us-east-1')
+
+        assert get_aws_client('cloudcontrol', 'us-east-1') is first
+        assert get_aws_client('cloudcontrol', 'us-west-2') is not first
+        assert mock_session.client.call_count == 2
+
+    @patch('awslabs.cfn_mcp_server.aws_client.session')
+    @patch('awslabs.cfn_mcp_server.aws_client.environ')
+    async def test_client_config(self, mock_environ, mock_session):
+        """Testing clients share a larger connection pool and adaptive retries."""
+        get_aws_client('cloudcontrol', 'us-east-1')
+
+        config = mock_session.client.call_args.kwargs['config']
+        assert config.max_pool_connections == 50
+        assert config.retries == {'mode': 'adaptive', 'max_attempts': 10}
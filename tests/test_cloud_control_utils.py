@@ -64,6 +64,14 @@ class TestUtils:
         with pytest.raises(ClientError):
             validate_patch([{'op': 'move', 'path': '/property', 'not-from': 'is bad'}])
 
+    async def test_patch_op_specific_fields(self):
+        """Testing required fields are checked per operation."""
+        validate_patch([{'op': 'copy', 'path': '/a', 'from': '/b'}, {'op': 'test', 'path': '/a', 'value': 1}])
+        with pytest.raises(ClientError, match="'test' operation requires a 'value'"):
+            validate_patch([{'op': 'test', 'path': '/a'}])
+        with pytest.raises(ClientError, match='is not supported'):
+            validate_patch([{'op': ['add'], 'path': '/a'}])
+
     async def test_progress_event(self):
         """Testing mapping progress event."""
         request = {
@@ -2,9 +2,16 @@
 
 import os
 import pytest
-from unittest.mock import patch, MagicMock
-from awslabs.cfn_mcp_server.documentation_knowledge_base import DocumentationKnowledgeBase
-from awslabs.cfn_mcp_server.knowledge_integration import enhance_template_response
+from unittest.mock import AsyncMock, patch, MagicMock
+from awslabs.cfn_mcp_server.documentation_knowledge_base import (
+    DocumentationKnowledgeBase,
+    get_knowledge_base,
+)
+from awslabs.cfn_mcp_server.knowledge_integration import (
+    _max_suggestions_from_env,
+    enhance_template_response,
+    enhance_with_knowledge,
+)
 
 class TestDocumentationKnowledge:
     """Test the documentation knowledge base."""
@@ -73,6 +80,149 @@ class TestDocumentationKnowledge:
         mock_kb.get_best_practices.assert_called()
         mock_kb.search_documentation.assert_called()
     
+    def test_enhance_template_queries_each_type_once(self, mock_kb):
+        """Repeated resource types share one lookup, and only their first resource gets suggestions."""
+        response = {
+            "success": True,
+            "template_content": (
+                "Resources:\n"
+                "  First:\n    Type: AWS::S3::Bucket\n"
+                "  Second:\n    Type: AWS::S3::Bucket\n"
+                "  Queue:\n    Type: AWS::SQS::Queue\n"
+            ),
+            "format": "YAML",
+        }
+        
+        enhanced = enhance_template_response(response, mock_kb)
+        
+        per_type_calls = [c for c in mock_kb.get_best_practices.call_args_list if c.args]
+        assert [c.args[0] for c in per_type_calls] == ["AWS::S3::Bucket", "AWS::SQS::Queue"]
+        assert [s["resource_id"] for s in enhanced["suggestions"] if "resource_id" in s] == [
+            "First", "Queue"
+        ]
+    
+    def test_enhance_template_skips_content_without_resources(self, mock_kb):
+        """Template content without a Resources section is returned without parsing."""
+        response = {
+            "success": True,
+            "template_content": "Parameters:\n  Env:\n    Type: String\n",
+            "format": "YAML",
+        }
+        
+        with patch('awslabs.cfn_mcp_server.knowledge_integration._load_yaml') as load_yaml:
+            assert enhance_template_response(response, mock_kb) is response
+        
+        load_yaml.assert_not_called()
+        assert "suggestions" not in response
+        
+        empty = enhance_template_response(
+            {"success": True, "template_content": "Resources:\n", "format": "YAML"}, mock_kb
+        )
+        assert [s["resource_type"] for s in empty["suggestions"] if s["type"] == "best_practice"] == [
+            "General"
+        ]
+    
+    def test_enhance_template_caps_suggestions(self, mock_kb):
+        """Suggestions stop at MAX_SUGGESTIONS."""
+        mock_kb.get_best_practices.side_effect = lambda resource_type=None, topic=None: [
+            {"practice": f"Practice {n} for {resource_type or topic}"} for n in range(3)
+        ]
+        template = {"Resources": {f"Queue{n}": {"Type": f"AWS::Test::Type{n}"} for n in range(5)}}
+        
+        with patch('awslabs.cfn_mcp_server.knowledge_integration.MAX_SUGGESTIONS', 7):
+            enhanced = enhance_template_response(
+                {"success": True, "template": template, "format": "JSON"}, mock_kb
+            )
+        
+        assert len(enhanced["suggestions"]) == 7
+        assert enhanced["suggestions"][-1]["resource_id"] == "Queue2"
+    
+    @pytest.mark.parametrize("value, expected", [
+        (None, 200), ("50", 50), ("0", 0), ("-5", 0), ("abc", 200), ("", 200),
+    ])
+    def test_max_suggestions_from_env(self, monkeypatch, value, expected):
+        """Invalid or negative CFN_MCP_MAX_SUGGESTIONS values fall back to a usable cap."""
+        if value is None:
+            monkeypatch.delenv("CFN_MCP_MAX_SUGGESTIONS", raising=False)
+        else:
+            monkeypatch.setenv("CFN_MCP_MAX_SUGGESTIONS", value)
+        
+        assert _max_suggestions_from_env() == expected
+    
+    @pytest.mark.asyncio
+    async def test_enhance_with_knowledge_skips_enhanced_responses(self, mock_kb):
+        """Responses that are already enhanced or opted out are returned untouched."""
+        responses = [
+            {"success": True, "resource_type": "AWS::S3::Bucket",
+             "knowledge_source": "CloudFormation Documentation"},
+            {"success": True, "resource_type": "AWS::S3::Bucket", "_skip_enhancement": True},
+        ]
+        
+        for response in responses:
+            expected = dict(response)
+            tool = enhance_with_knowledge(AsyncMock(return_value=response))
+            with patch('awslabs.cfn_mcp_server.knowledge_integration._knowledge_base',
+                       return_value=mock_kb):
+                assert await tool() == expected
+        
+        mock_kb.get_best_practices.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_enhance_with_knowledge_dispatches_by_response_key(self, mock_kb):
+        """Resource responses gain best practices; enhancement failures keep the response."""
+        tool = enhance_with_knowledge(
+            AsyncMock(side_effect=lambda: {"success": True, "resource_type": "AWS::S3::Bucket"})
+        )
+        with patch('awslabs.cfn_mcp_server.knowledge_integration._knowledge_base',
+                   return_value=mock_kb):
+            enhanced = await tool()
+        assert enhanced["best_practices"] == mock_kb.get_best_practices.return_value
+        
+        mock_kb.get_best_practices.side_effect = RuntimeError("index unavailable")
+        with patch('awslabs.cfn_mcp_server.knowledge_integration._knowledge_base',
+                   return_value=mock_kb):
+            assert await tool() == {"success": True, "resource_type": "AWS::S3::Bucket"}
+    
+    def test_knowledge_lookups_are_cached(self, tmp_path):
+        """Repeated lookups are served from cache without sharing mutable results."""
+        kb = DocumentationKnowledgeBase(docs_path=str(tmp_path))
+        kb.document_index["user_guide/ec2.html"] = {"title": "EC2 best practices", "type": "user_guide"}
+        kb.document_content["user_guide/ec2.html"] = (
+            "Best practices for AWS::EC2::Instance error handling\n"
+            "- Use launch templates for every AWS::EC2::Instance you create\n"
+            "- To fix an error, check the instance profile permissions first"
+        )
+        practices = DocumentationKnowledgeBase._cached_best_practices
+        guidance = DocumentationKnowledgeBase._cached_troubleshooting_guidance
+        practice_hits = practices.cache_info().hits
+        guidance_hits = guidance.cache_info().hits
+
+        first = kb.get_best_practices("AWS::EC2::Instance")
+        assert first
+        first[0]["practice"] = "changed"
+        first.append({"practice": "extra"})
+        assert kb.get_best_practices("AWS::EC2::Instance") == [
+            {"practice": "Use launch templates for every AWS::EC2::Instance you create",
+             "source": "CloudFormation Documentation"},
+            {"practice": "To fix an error, check the instance profile permissions first",
+             "source": "CloudFormation Documentation"},
+        ]
+
+        steps = kb.get_troubleshooting_guidance("instance error")
+        steps.clear()
+        assert kb.get_troubleshooting_guidance("instance error")
+        assert practices.cache_info().hits == practice_hits + 1
+        assert guidance.cache_info().hits == guidance_hits + 1
+    
+    def test_fallback_knowledge_base_is_reused(self):
+        """A knowledge base that fails to load is replaced once, not on every call."""
+        with patch('awslabs.cfn_mcp_server.documentation_knowledge_base._knowledge_base', None), \
+             patch('awslabs.cfn_mcp_server.documentation_knowledge_base.DocumentationKnowledgeBase',
+                   side_effect=[RuntimeError("bad docs"), MagicMock()]) as kb_class:
+            fallback = get_knowledge_base()
+            assert get_knowledge_base() is fallback
+            assert kb_class.call_count == 2
+    
     def test_search_documentation(self, mock_kb):
         """Test searching documentation."""
         results = mock_kb.search_documentation("S3 bucket")
@@ -0,0 +1,38 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the input validator."""
+
+import pytest
+from awslabs.cfn_mcp_server.input_validator import (
+    InputValidator,
+    ValidationError,
+    _KNOWN_RESOURCE_TYPES,
+)
+
+
+def test_known_resource_types_pass_the_format_check():
+    """Every fast-path type is one the full check would also accept."""
+    for resource_type in _KNOWN_RESOURCE_TYPES:
+        assert InputValidator.AWS_RESOURCE_TYPE_PATTERN.match(resource_type)
+
+
+def test_validate_aws_resource_type():
+    """Known and well-formed types pass; malformed input is rejected."""
+    assert InputValidator.validate_aws_resource_type('AWS::S3::Bucket') == 'AWS::S3::Bucket'
+    assert InputValidator.validate_aws_resource_type('AWS::Pipes::Pipe') == 'AWS::Pipes::Pipe'
+
+    for invalid in ('', None, ['AWS::S3::Bucket'], 'AWS::S3', 'aws::s3::bucket', 'AWS::X::' + 'Y' * 100):
+        with pytest.raises(ValidationError):
+            InputValidator.validate_aws_resource_type(invalid)
@@ -0,0 +1,216 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the intelligent template generator."""
+
+from awslabs.cfn_mcp_server.intelligent_template_generator import (
+    IntelligentTemplateGenerator,
+    _KeywordScanner,
+)
+from unittest.mock import patch
+
+
+@patch('awslabs.cfn_mcp_server.intelligent_template_generator.get_aws_client')
+def test_client_created_lazily(mock_get_client):
+    """The CloudFormation client is only built on first access and then reused."""
+    generator = IntelligentTemplateGenerator('us-east-1')
+    generator.analyze_description('A serverless API with DynamoDB')
+    mock_get_client.assert_not_called()
+
+    assert generator.client is generator.client
+    mock_get_client.assert_called_once_with('cloudformation', 'us-east-1')
+
+
+def test_scale_and_security_requirements():
+    """Requirement indicators are detected from the description."""
+    generator = IntelligentTemplateGenerator('us-east-1')
+    analysis = generator.analyze_description(
+        'A fault tolerant, low latency service that must auto scale behind HTTPS in a private VPC'
+    )
+
+    scale = analysis['scale_requirements']
+    assert scale['high_availability'] is True
+    assert scale['multi_az'] is True
+    assert scale['auto_scaling'] is True
+    assert scale['performance_tier'] == 'high'
+
+    security = analysis['security_requirements']
+    assert security['encryption'] is True
+    assert security['vpc_isolation'] is True
+    assert security['ssl_tls'] is True
+
+
+def test_basic_performance_tier():
+    """Basic wording maps to the basic performance tier without extra requirements."""
+    generator = IntelligentTemplateGenerator('us-east-1')
+    analysis = generator.analyze_description('A simple bucket')
+
+    assert analysis['scale_requirements']['performance_tier'] == 'basic'
+    assert analysis['security_requirements']['ssl_tls'] is False
+
+
+def test_generate_architecture_template_dispatch():
+    """Known architectures use their generator; anything else falls back per resource."""
+    generator = IntelligentTemplateGenerator('us-east-1')
+    analysis = {'architecture_pattern': 'web_application', 'resources': {}}
+
+    with patch.dict(
+        'awslabs.cfn_mcp_server.intelligent_template_generator._ARCHITECTURE_GENERATORS',
+        {'web_application': lambda a, c: {'Marker': {'Type': 'Test'}}},
+    ):
+        assert generator.generate_architecture_template(analysis) == {
+            'Marker': {'Type': 'Test'}
+        }
+
+    fallback = generator.generate_architecture_template(
+        {'architecture_pattern': None, 'resources': {'s3': 'AWS::S3::Bucket'}}
+    )
+    assert any(r['Type'] == 'AWS::S3::Bucket' for r in fallback['resources'].values())
+    assert generator._resource_generator is generator._resource_generator
+
+
+def test_identify_resources_specific_and_default():
+    """Named resources win within a category; otherwise the category default is used."""
+    generator = IntelligentTemplateGenerator('us-east-1')
+
+    resources = generator._identify_resources('lambda behind an api gateway writing to dynamodb')
+    assert resources == {
+        'lambda': 'AWS::Lambda::Function',
+        'dynamodb': 'AWS::DynamoDB::Table',
+        'api': 'AWS::ApiGateway::RestApi',
+    }
+
+    assert generator._identify_resources('a virtual machine') == {'ec2': 'AWS::EC2::Instance'}
+
+
+def test_requirements_are_plain_dicts_in_analysis():
+    """Requirement tuples are converted to dicts so analyses stay JSON friendly."""
+    generator = IntelligentTemplateGenerator('us-east-1')
+    analysis = generator.analyze_description('An internal tool')
+
+    assert analysis['security_requirements'] == {
+        'encryption': False,
+        'vpc_isolation': True,
+        'iam_roles': True,
+        'security_groups': True,
+        'ssl_tls': False,
+    }
+    scale = generator._analyze_scale_requirements(generator._keyword_scanner.scan('redundant'))
+    assert scale.multi_az is True
+
+
+def test_identify_architecture_pattern():
+    """More specific architecture patterns win over generic ones."""
+    generator = IntelligentTemplateGenerator('us-east-1')
+
+    def identify(description):
+        hits = generator._keyword_scanner.scan(description)
+        return generator._identify_architecture_pattern(hits)
+
+    assert identify('an etl job') == 'data_pipeline'
+    assert identify('a website and a rest api') == 'web_application'
+    assert identify('a static website') == 'static_website'
+    assert identify('an analytics api') == 'data_pipeline'
+    assert identify('nothing to see') is None
+
+
+def test_keyword_scanner_reports_overlapping_keywords():
+    """Keywords sharing a start position are all reported, at word starts only."""
+    scanner = _KeywordScanner({'short': ('data',), 'long': ('database',), 'abbr': ('ha',)})
+
+    assert scanner.scan('a database') == {'short', 'long'}
+    assert scanner.scan('some datasets') == {'short'}
+    assert scanner.scan('metadata that we share') == set()
+    assert scanner.scan('ha setup') == {'abbr'}
+
+
+def test_analyze_requirements():
+    """Requirement statements are reported in their declared order."""
+    generator = IntelligentTemplateGenerator('us-east-1')
+    requirements = generator._analyze_requirements(
+        'Secure API with login and a database, on a budget', {'architecture_pattern': None}
+    )
+
+    assert requirements['functional_requirements'] == [
+        'Provide API endpoints for data access',
+        'Store and retrieve application data',
+        'Authenticate and authorize users',
+    ]
+    assert requirements['non_functional_requirements'] == ['Implement security best practices']
+    assert requirements['constraints'] == ['Cost optimization required']
+
+
+def test_identify_resources_overlapping_categories():
+    """Overlapping phrases from different categories are all detected in one scan."""
+    generator = IntelligentTemplateGenerator('us-east-1')
+
+    resources = generator._identify_resources('sql server on a server streaming to firehose')
+    assert resources == {
+        'ec2': 'AWS::EC2::Instance',
+        'rds': 'AWS::RDS::DBInstance',
+        'firehose': 'AWS::KinesisFirehose::DeliveryStream',
+    }
+
+
+def test_identify_resources_categories_matching_at_same_position():
+    """Categories whose phrases start at the same offset are all detected."""
+    generator = IntelligentTemplateGenerator('us-east-1')
+
+    assert generator._identify_resources('a key-value store') == {
+        'rds': 'AWS::RDS::DBInstance',
+        'iam': 'AWS::IAM::Role',
+    }
+
+
+def test_analyze_description_results_are_independent():
+    """Cached scans never leak mutations between analyses of the same text."""
+    generator = IntelligentTemplateGenerator('us-east-1')
+    first = generator.analyze_description('An S3 bucket')
+    first['resources']['extra'] = 'AWS::SNS::Topic'
+
+    with patch.object(generator, '_identify_resources') as mock_identify:
+        second = generator.analyze_description('An S3 bucket')
+    assert second['resources'] == {'s3': 'AWS::S3::Bucket'}
+    mock_identify.assert_not_called()
+
+
+def test_scan_cache_is_per_instance_and_bounded():
+    """Scan results stay with their generator and old descriptions are evicted."""
+    generator = IntelligentTemplateGenerator('us-east-1')
+    generator.analyze_description('An S3 bucket')
+    assert IntelligentTemplateGenerator('us-east-1')._scan_cache == {}
+
+    with patch('awslabs.cfn_mcp_server.intelligent_template_generator._SCAN_CACHE_SIZE', 2):
+        generator.analyze_description('A queue')
+        generator.analyze_description('A topic')
+    assert list(generator._scan_cache) == ['a queue', 'a topic']
+
+
+def test_discovery_uses_detected_architecture():
+    """Suggestions and assumptions follow the architecture names analysis returns."""
+    generator = IntelligentTemplateGenerator('us-east-1')
+
+    web = generator.create_discovery_prompt('A web application with a backend')
+    assert web['initial_analysis']['architecture_pattern'] == 'web_application'
+    assert [p['name'] for p in web['architecture_patterns']] == [
+        '3-Tier Web Application',
+        'Serverless Web Application',
+    ]
+    assert (
+        'Internet-facing application with public access'
+        in web['requirements_analysis']['assumptions']
+    )
+
+    pipeline = generator.create_discovery_prompt('An etl data pipeline')
+    assert pipeline['architecture_patterns'][0]['name'] == 'Batch Processing Pipeline'
@@ -0,0 +1,130 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the prompt quality validator."""
+
+import pytest
+from awslabs.cfn_mcp_server.prompt_validator import PromptValidator, ValidationContext
+
+
+def test_keywords_match_case_insensitively_as_substrings():
+    """Prompts are lowered once and indicators match inside longer words."""
+    validator = PromptValidator()
+    result = validator.validate_prompt_quality(
+        'ARCHITECTURE REQUIREMENTS, Security Requirements, operational requirements, '
+        'deliverables. Parameters, outputs, resources, monitoring, backup, scaling, '
+        'networking, IAM and encryption.',
+        {},
+    )
+
+    assert result.component_scores['completeness'] == 1.0
+
+
+def test_empty_prompt_is_poor():
+    """A prompt with no recognised content is rated poorly with suggestions."""
+    validator = PromptValidator()
+    result = validator.validate_prompt_quality('', {'architecture_type': 'web_application'})
+
+    assert result.quality_level == 'POOR'
+    assert result.component_scores['specificity'] == 0
+    assert result.improvement_suggestions
+
+
+def test_shared_keyword_counts_for_every_group():
+    """A keyword listed in several groups is found once and scored in each."""
+    validator = PromptValidator()
+    result = validator.validate_prompt_quality('Attach IAM roles', {})
+
+    assert result.component_scores['completeness'] == pytest.approx(0.04)
+    assert result.component_scores['specificity'] == pytest.approx(0.08)
+
+
+def test_min_quality_stops_once_target_is_out_of_reach():
+    """Scoring stops early and reports POOR when min_quality cannot be met."""
+    validator = PromptValidator()
+    result = validator.validate_prompt_quality('deliverables', {}, min_quality='GOOD')
+
+    assert result.quality_level == 'POOR'
+    assert list(result.component_scores) == ['completeness']
+    assert result.improvement_suggestions == [
+        'Add more comprehensive sections covering security, monitoring, backup, and '
+        'operational requirements'
+    ]
+
+
+def test_min_quality_keeps_full_result_when_reachable():
+    """A prompt that can still meet min_quality is scored exactly as without it."""
+    validator = PromptValidator()
+    prompt = 'Deliverables: security requirements with encryption and monitoring'
+
+    assert validator.validate_prompt_quality(
+        prompt, {}, min_quality='POOR'
+    ) == validator.validate_prompt_quality(prompt, {})
+
+
+def test_result_converts_to_dict_for_responses():
+    """Results convert to plain dicts, and enhancement accepts either form."""
+    validator = PromptValidator()
+    result = validator.validate_prompt_quality('', {})
+    as_dict = result.to_dict()
+
+    assert type(as_dict) is dict
+    assert list(as_dict) == [
+        'overall_score',
+        'component_scores',
+        'feedback',
+        'quality_level',
+        'improvement_suggestions',
+    ]
+    assert validator.enhance_prompt_based_on_validation(
+        'prompt', as_dict, {}
+    ) == validator.enhance_prompt_based_on_validation('prompt', result, {})
+
+
+def test_prepared_context_matches_dict_context():
+    """A prepared context scores like the dict it came from, matching case-insensitively."""
+    validator = PromptValidator()
+    context = {
+        'architecture_type': 'Web_Application',
+        'compliance_requirements': ['HIPAA'],
+        'implicit_requirements': {'security': ['Encrypt data'], 'performance': []},
+    }
+    prepared = validator.prepare_context(context)
+
+    assert prepared == ValidationContext(
+        architecture_type='Web_Application',
+        compliance_requirements=('HIPAA',),
+        architecture_type_lower='web_application',
+        compliance_requirements_lower=('hipaa',),
+        implicit_requirements=frozenset({'Encrypt data'}),
+    )
+    prompt = 'A HIPAA compliant web_application with security monitoring'
+    result = validator.validate_prompt_quality(prompt, prepared)
+    assert result == validator.validate_prompt_quality(prompt, context)
+    assert result.component_scores['context_awareness'] == pytest.approx(0.6 + 0.2 * 2 / 3)
+
+
+def test_suggestions_quote_context_values_as_given():
+    """Improvement suggestions keep the caller's casing of context values."""
+    validator = PromptValidator()
+    context = {'architecture_type': 'Microservices', 'compliance_requirements': ['HIPAA', 'PCI-DSS']}
+
+    result = validator.validate_prompt_quality('A short prompt', context)
+
+    assert 'Better incorporate Microservices architecture-specific requirements and best practices' in (
+        result.improvement_suggestions
+    )
+    assert 'Address HIPAA, PCI-DSS compliance requirements more thoroughly' in (
+        result.improvement_suggestions
+    )
@@ -0,0 +1,201 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the resource generator."""
+
+from awslabs.cfn_mcp_server.resource_generator import ResourceGenerator
+from unittest.mock import MagicMock
+
+
+def test_generate_resources_dispatch():
+    """Each known type uses its generator and unknown types are skipped."""
+    generator = ResourceGenerator()
+    result = generator.generate_resources({
+        'resources': {
+            'assets': 'AWS::S3::Bucket',
+            'events': 'AWS::Kinesis::Stream',
+            'topic': 'AWS::SNS::Topic',
+        },
+    })
+
+    assert {name: r['Type'] for name, r in result['resources'].items()} == {
+        'AssetsBucket': 'AWS::S3::Bucket',
+        'EventsStream': 'AWS::Kinesis::Stream',
+    }
+    assert result['parameters'] == {}
+
+
+def test_description_keywords_match_substrings():
+    """Description keywords match case-insensitively anywhere in the text."""
+    generator = ResourceGenerator()
+    result = generator.generate_resources({
+        'resources': {'handler': 'AWS::Lambda::Function', 'main': 'AWS::RDS::DBInstance'},
+        'original_description': 'A Node.js function reading from PostgreSQL',
+    })['resources']
+
+    assert result['HandlerFunction']['Properties']['Handler'] == 'index.handler'
+    assert result['HandlerFunction']['Properties']['Code']['ZipFile'].startswith('exports.handler')
+    assert result['MainDatabase']['Properties']['Engine'] == 'postgres'
+
+
+def test_config_lookups_are_cached():
+    """Repeated resources of one type read each setting from the configuration once."""
+    config = MagicMock()
+    config.get_resource_config.side_effect = lambda resource, tier, key, default: default
+    config.get_config.side_effect = lambda path, default=None: default
+    generator = ResourceGenerator(config)
+
+    analysis = {'resources': {f'stream{i}': 'AWS::Kinesis::Stream' for i in range(5)}}
+    generator.generate_resources(analysis)
+    generator.generate_resources(analysis)
+
+    assert config.get_resource_config.call_count == 2
+
+
+def test_config_cache_is_per_generator_and_clearable():
+    """Each generator memoizes its own config; clearing picks up changed values."""
+    config = MagicMock()
+    config.get_config.side_effect = lambda path, default=None: default
+    config.get_resource_config.return_value = 'ON_DEMAND'
+    generator = ResourceGenerator(config)
+    assert generator._resource_config('kinesis', 'standard', 'mode', None) == 'ON_DEMAND'
+
+    config.get_resource_config.return_value = 'PROVISIONED'
+    assert generator._resource_config('kinesis', 'standard', 'mode', None) == 'ON_DEMAND'
+    assert ResourceGenerator(config)._resource_config('kinesis', 'standard', 'mode', None) == 'PROVISIONED'
+
+    generator.clear_config_cache()
+    assert generator._resource_config('kinesis', 'standard', 'mode', None) == 'PROVISIONED'
+
+
+def test_lambda_language_follows_table_order():
+    """The first language in table order wins; Python is the default."""
+    generator = ResourceGenerator()
+
+    def runtime_for(description):
+        resources = generator.generate_resources({
+            'resources': {'fn': 'AWS::Lambda::Function'},
+            'original_description': description,
+        })['resources']
+        return resources['FnFunction']['Properties']['Runtime']
+
+    assert runtime_for('a javascript function') == 'nodejs18.x'
+    assert runtime_for('ruby or java') == 'java17'
+    assert runtime_for('golang worker') == 'go1.x'
+    assert runtime_for('plain function') == 'python3.11'
+
+
+def test_security_group_ingress_rules():
+    """Configured rules map to ingress entries; without rules SSH is opened."""
+    config = MagicMock()
+    config.get_resource_config.side_effect = lambda resource, tier, key, default: default
+    config.get_config.side_effect = lambda path, default=None: default
+    config.get_latest_ami.return_value = 'ami-123'
+    generator = ResourceGenerator(config)
+    analysis = {'resources': {'web': 'AWS::EC2::Instance'}}
+
+    config.get_security_group_config.return_value = [{'port': 443, 'cidr': '10.0.0.0/8'}]
+    ingress = generator.generate_resources(analysis)['resources']['WebSecurityGroup'][
+        'Properties']['SecurityGroupIngress']
+    assert ingress == [{'IpProtocol': 'tcp', 'FromPort': 443, 'ToPort': 443, 'CidrIp': '10.0.0.0/8'}]
+
+    config.get_security_group_config.return_value = []
+    ingress = generator.generate_resources(analysis)['resources']['WebSecurityGroup'][
+        'Properties']['SecurityGroupIngress']
+    assert ingress == [{'IpProtocol': 'tcp', 'FromPort': 22, 'ToPort': 22, 'CidrIp': '0.0.0.0/0'}]
+
+
+def test_rds_engine_selection():
+    """Engines follow table order; Aurora picks the matching Aurora flavour."""
+    generator = ResourceGenerator()
+
+    def engine_for(description):
+        resources = generator.generate_resources({
+            'resources': {'main': 'AWS::RDS::DBInstance'},
+            'original_description': description,
+        })['resources']
+        properties = resources['MainDatabase']['Properties']
+        return properties['Engine'], properties['EngineVersion']
+
+    assert engine_for('a mariadb database') == ('mariadb', '10.6.14')
+    assert engine_for('a database') == ('mysql', '8.0.33')
+    assert engine_for('aurora postgres cluster') == ('aurora-postgresql', '15.3')
+    assert engine_for('aurora') == ('aurora-mysql', '8.0.mysql_aurora.3.04.0')
+    assert engine_for('aurora mysql') == ('aurora-mysql', '8.0.mysql_aurora.3.04.0')
+
+
+def test_missing_requirements_use_defaults():
+    """Absent or empty requirement sections fall back to the standard tier."""
+    generator = ResourceGenerator()
+    result = generator.generate_resources({
+        'resources': {'events': 'AWS::Kinesis::Stream'},
+        'security_requirements': None,
+    })['resources']
+
+    properties = result['EventsStream']['Properties']
+    assert properties['StreamModeDetails'] == {'StreamMode': 'PROVISIONED'}
+    assert properties['StreamEncryption']['EncryptionType'] == 'KMS'
+    assert 'VPC' not in result
+
+
+def test_lambda_roles_do_not_share_policy_lists():
+    """Roles with the same policies get equal but independent lists."""
+    generator = ResourceGenerator()
+    result = generator.generate_resources({
+        'resources': {'reader': 'AWS::Lambda::Function', 'writer': 'AWS::Lambda::Function'},
+        'original_description': 'functions reading an s3 bucket',
+    })['resources']
+
+    reader = result['ReaderFunctionRole']['Properties']['ManagedPolicyArns']
+    writer = result['WriterFunctionRole']['Properties']['ManagedPolicyArns']
+    assert reader == writer == [
+        'arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole',
+        'arn:aws:iam::aws:policy/AmazonS3ReadOnlyAccess',
+    ]
+    assert reader is not writer
+
+
+def test_kinesis_stream_modes():
+    """On-demand streams carry no shard count; busy provisioned streams get more shards."""
+    generator = ResourceGenerator()
+
+    def stream_for(description, tier='standard'):
+        resources = generator.generate_resources({
+            'resources': {'events': 'AWS::Kinesis::Stream'},
+            'original_description': description,
+            'scale_requirements': {'performance_tier': tier},
+        })['resources']
+        return resources['EventsStream']['Properties']
+
+    on_demand = stream_for('an on demand stream')
+    assert on_demand['StreamModeDetails'] == {'StreamMode': 'ON_DEMAND'}
+    assert 'ShardCount' not in on_demand
+    assert 'ShardCount' not in stream_for('a stream', tier='high')
+
+    provisioned = stream_for('a high volume stream')
+    assert provisioned['StreamModeDetails'] == {'StreamMode': 'PROVISIONED'}
+    assert provisioned['ShardCount'] >= 5
+
+
+def test_database_password_follows_resource_type():
+    """The password resource depends on the RDS type, not on the resource key."""
+    generator = ResourceGenerator()
+
+    result = generator.generate_resources({'resources': {'main': 'AWS::RDS::DBInstance'}})
+    assert 'DatabasePassword' in result['resources']
+    assert 'DatabasePassword' in result['parameters']
+
+    result = generator.generate_resources({'resources': {'cards': 'AWS::DynamoDB::Table'}})
+    assert 'DatabasePassword' not in result['resources']
+    assert result['parameters'] == {}
@@ -0,0 +1,80 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the resource mapping helpers."""
+
+import pytest
+from awslabs.cfn_mcp_server.resource_mapping import (
+    ARCHITECTURE_PATTERNS,
+    RESOURCE_MAPPING,
+    _identify_resources,
+    get_related_resources,
+    identify_resources_from_description,
+)
+
+
+def test_identify_resources_results_are_independent():
+    """Cached lookups never leak mutations between calls for the same text."""
+    first = identify_resources_from_description('A Lambda function')
+    first['Extra'] = 'AWS::SNS::Topic'
+    hits_before = _identify_resources.cache_info().hits
+
+    second = identify_resources_from_description('a lambda FUNCTION')
+    assert 'Extra' not in second
+    assert set(second.values()) == {'AWS::Lambda::Function'}
+    assert _identify_resources.cache_info().hits == hits_before + 1
+
+
+def test_related_resources_depend_only_on_types():
+    """Related resources follow the set of resource types, whatever the names."""
+    related = get_related_resources({'Fn': 'AWS::Lambda::Function', 'Web': 'AWS::EC2::Instance'})
+    assert related == {
+        'LambdaExecutionRole': 'AWS::IAM::Role',
+        'InstanceSecurityGroup': 'AWS::EC2::SecurityGroup',
+        'VPC': 'AWS::EC2::VPC',
+        'Subnet1': 'AWS::EC2::Subnet',
+        'Subnet2': 'AWS::EC2::Subnet',
+    }
+
+    related['Extra'] = 'AWS::SNS::Topic'
+    assert 'Extra' not in get_related_resources({'Other': 'AWS::EC2::Instance', 'F': 'AWS::Lambda::Function'})
+
+
+def test_mapping_tables_are_read_only():
+    """The shared term and pattern tables cannot be changed by callers."""
+    with pytest.raises(TypeError):
+        RESOURCE_MAPPING['s3'] = 'AWS::SNS::Topic'
+    with pytest.raises(TypeError):
+        ARCHITECTURE_PATTERNS['static website']['components'] = ()
+    assert isinstance(ARCHITECTURE_PATTERNS['static website']['components'], tuple)
+
+
+def test_identified_resource_names_are_numbered_per_prefix():
+    """Each hit adds a resource numbered after existing names sharing its prefix."""
+    assert identify_resources_from_description('microservices on kubernetes') == {
+        'Service1': 'AWS::ECS::Service',
+        'Cluster1': 'AWS::ECS::Cluster',
+        'LoadBalancer1': 'AWS::ElasticLoadBalancingV2::LoadBalancer',
+        'VPC1': 'AWS::EC2::VPC',
+        'Cluster2': 'AWS::EKS::Cluster',
+    }
+    assert identify_resources_from_description('serverless api using lambda') == {
+        'RestApi1': 'AWS::ApiGateway::RestApi',
+        'Function1': 'AWS::Lambda::Function',
+        'Role1': 'AWS::IAM::Role',
+        'Instance1': 'AWS::EC2::Instance',
+        'Function2': 'AWS::Lambda::Function',
+        'Function3': 'AWS::Lambda::Function',
+        'RestApi2': 'AWS::ApiGateway::RestApi',
+    }
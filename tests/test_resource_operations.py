@@ -0,0 +1,267 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the Cloud Control resource operations."""
+
+import asyncio
+import threading
+import time
+import pytest
+from awslabs.cfn_mcp_server.errors import ClientError
+from awslabs.cfn_mcp_server.resource_operations import ResourceOperations
+from unittest.mock import MagicMock, patch
+
+
+@patch('awslabs.cfn_mcp_server.resource_operations.get_aws_client')
+def test_list_resources_flattens_pages(mock_get_aws_client):
+    """Identifiers from every page are returned in order."""
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'ResourceDescriptions': [{'Identifier': 'a'}, {'Identifier': 'b'}]},
+        {},
+        {'ResourceDescriptions': [{'Identifier': 'c'}]},
+    ]
+    mock_get_aws_client.return_value = mock_client
+
+    assert ResourceOperations.list_resources('AWS::S3::Bucket', 'us-east-1') == ['a', 'b', 'c']
+    assert asyncio.run(
+        ResourceOperations.list_resources_async('AWS::S3::Bucket', 'us-east-1')
+    ) == ['a', 'b', 'c']
+    mock_client.get_paginator.return_value.paginate.assert_called_with(
+        TypeName='AWS::S3::Bucket', PaginationConfig={'PageSize': 100}
+    )
+
+
+@patch('awslabs.cfn_mcp_server.resource_operations.get_aws_client')
+def test_iter_resources_is_lazy(mock_get_aws_client):
+    """Streaming callers only fetch pages as they consume identifiers."""
+    fetched = []
+
+    def pages(**kwargs):
+        for n in range(3):
+            fetched.append(n)
+            yield {'ResourceDescriptions': [{'Identifier': str(n)}]}
+
+    mock_get_aws_client.return_value.get_paginator.return_value.paginate.side_effect = pages
+
+    identifiers = ResourceOperations.iter_resources('AWS::S3::Bucket', 'us-east-1')
+    assert next(identifiers) == '0'
+    assert fetched == [0]
+
+
+def test_list_resources_invalid_type():
+    """Invalid resource types surface as client errors."""
+    with pytest.raises(ClientError):
+        ResourceOperations.list_resources('not-a-type', 'us-east-1')
+
+
+@patch('awslabs.cfn_mcp_server.resource_operations.progress_event')
+@patch('awslabs.cfn_mcp_server.resource_operations.get_aws_client')
+def test_create_and_update_send_json(mock_get_aws_client, mock_progress_event):
+    """Desired state and patch documents are sent to Cloud Control as JSON."""
+    mock_client = mock_get_aws_client.return_value
+
+    ResourceOperations.create_resource(
+        'AWS::S3::Bucket', {'BucketName': 'b', 'Versioned': True, 'Tags': None}, 'us-east-1'
+    )
+    assert mock_client.create_resource.call_args.kwargs['DesiredState'] == (
+        '{"BucketName":"b","Versioned":true,"Tags":null}'
+    )
+
+    ResourceOperations.update_resource(
+        'AWS::S3::Bucket', 'b', [{'op': 'remove', 'path': '/Tags'}], 'us-east-1'
+    )
+    assert mock_client.update_resource.call_args.kwargs['PatchDocument'] == (
+        '[{"op":"remove","path":"/Tags"}]'
+    )
+
+
+@pytest.mark.asyncio
+@patch('awslabs.cfn_mcp_server.resource_operations.progress_event')
+@patch('awslabs.cfn_mcp_server.resource_operations.get_aws_client')
+async def test_async_operations_run_concurrently(mock_get_aws_client, mock_progress_event):
+    """Async variants can be gathered and return the sync results."""
+    mock_progress_event.side_effect = lambda event, *args: {'request_token': event}
+    mock_client = mock_get_aws_client.return_value
+    mock_client.create_resource.side_effect = lambda **kwargs: {'ProgressEvent': 'create'}
+    mock_client.delete_resource.side_effect = lambda **kwargs: {'ProgressEvent': 'delete'}
+    mock_client.get_resource_request_status.side_effect = lambda **kwargs: {'ProgressEvent': 'status'}
+    mock_client.get_resource.side_effect = lambda **kwargs: {
+        'ResourceDescription': {'Properties': '{}'}
+    }
+
+    results = await asyncio.gather(
+        ResourceOperations.create_resource_async('AWS::S3::Bucket', {}, 'us-east-1'),
+        ResourceOperations.delete_resource_async('AWS::S3::Bucket', 'b', 'us-east-1'),
+        ResourceOperations.get_resource_request_status_async('token', 'us-east-1'),
+        ResourceOperations.get_resource_async('AWS::S3::Bucket', 'b', 'us-east-1'),
+    )
+
+    assert results == [
+        {'request_token': 'create'},
+        {'request_token': 'delete'},
+        {'request_token': 'status'},
+        {'identifier': 'b', 'properties': '{}'},
+    ]
+
+
+@patch('awslabs.cfn_mcp_server.resource_operations.get_aws_client')
+def test_aws_errors_are_mapped(mock_get_aws_client):
+    """AWS API failures surface as mapped client errors."""
+    mock_get_aws_client.return_value.delete_resource.side_effect = Exception('AccessDenied')
+
+    with pytest.raises(ClientError, match='Access denied'):
+        ResourceOperations.delete_resource('AWS::S3::Bucket', 'b', 'us-east-1')
+
+
+@patch('awslabs.cfn_mcp_server.resource_operations.get_aws_client')
+def test_request_status_is_normalized(mock_get_aws_client):
+    """Progress events are mapped to the MCP output format, hook messages included."""
+    mock_get_aws_client.return_value.get_resource_request_status.return_value = {
+        'ProgressEvent': {
+            'OperationStatus': 'FAILED',
+            'TypeName': 'AWS::S3::Bucket',
+            'RequestToken': 'token',
+            'StatusMessage': 'failed',
+        },
+        'HooksProgressEvent': [{'HookStatus': 'HOOK_FAILED', 'HookStatusMessage': 'hook says no'}],
+    }
+
+    assert ResourceOperations.get_resource_request_status('token', 'us-east-1') == {
+        'status': 'FAILED',
+        'resource_type': 'AWS::S3::Bucket',
+        'is_complete': True,
+        'request_token': 'token',
+        'status_message': 'hook says no',
+    }
+
+
+@pytest.mark.asyncio
+@patch('awslabs.cfn_mcp_server.resource_operations.MAX_CONCURRENT_REQUESTS', 2)
+@patch('awslabs.cfn_mcp_server.resource_operations.get_aws_client')
+async def test_get_resources_bounded_and_ordered(mock_get_aws_client):
+    """Batch gets keep identifier order and never exceed the concurrency limit."""
+    lock = threading.Lock()
+    active = []
+    peak = []
+
+    def get_resource(TypeName, Identifier):
+        with lock:
+            active.append(Identifier)
+            peak.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.remove(Identifier)
+        return {'ResourceDescription': {'Properties': f'{{"Name": "{Identifier}"}}'}}
+
+    mock_get_aws_client.return_value.get_resource.side_effect = get_resource
+    identifiers = [f'bucket-{i}' for i in range(6)]
+
+    results = await ResourceOperations.get_resources_async('AWS::S3::Bucket', identifiers, 'us-east-1')
+
+    assert [r['identifier'] for r in results] == identifiers
+    assert max(peak) <= 2
+
+
+@pytest.mark.asyncio
+@patch('awslabs.cfn_mcp_server.resource_operations.get_aws_client')
+async def test_get_resources_creates_one_client_on_the_calling_thread(mock_get_aws_client):
+    """The client is resolved once, before the fan-out, not by each worker thread."""
+    callers = []
+    mock_get_aws_client.side_effect = lambda *args: callers.append(threading.get_ident()) or MagicMock()
+
+    await ResourceOperations.get_resources_async('AWS::S3::Bucket', ['a', 'b', 'c'], 'us-east-1')
+
+    assert callers == [threading.get_ident()]
+
+
+@pytest.mark.asyncio
+@patch('awslabs.cfn_mcp_server.resource_operations.get_aws_client')
+async def test_get_resources_reports_failures_per_identifier(mock_get_aws_client):
+    """One missing resource gets an error entry without discarding the others."""
+
+    def get_resource(TypeName, Identifier):
+        if Identifier == 'missing':
+            raise Exception('ResourceNotFoundException: no such bucket')
+        return {'ResourceDescription': {'Properties': '{}'}}
+
+    mock_get_aws_client.return_value.get_resource.side_effect = get_resource
+
+    results = await ResourceOperations.get_resources_async(
+        'AWS::S3::Bucket', ['a', 'missing', 'b'], 'us-east-1'
+    )
+
+    assert results[0] == {'identifier': 'a', 'properties': '{}'}
+    assert results[1] == {'identifier': 'missing', 'error': 'Resource was not found'}
+    assert results[2] == {'identifier': 'b', 'properties': '{}'}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'resource_type, identifiers',
+    [
+        ('not-a-type', ['a']),
+        ('AWS::S3::Bucket', 'a'),
+        ('AWS::S3::Bucket', ['a', '']),
+        ('AWS::S3::Bucket', ['x' * 257]),
+    ],
+)
+@patch('awslabs.cfn_mcp_server.resource_operations.get_aws_client')
+async def test_get_resources_validates_inputs(mock_get_aws_client, resource_type, identifiers):
+    """Bad resource types and identifiers are rejected before any AWS call."""
+    with pytest.raises(ClientError):
+        await ResourceOperations.get_resources_async(resource_type, identifiers, 'us-east-1')
+
+    mock_get_aws_client.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch('awslabs.cfn_mcp_server.resource_operations.progress_event')
+@patch('awslabs.cfn_mcp_server.resource_operations.get_aws_client')
+async def test_async_operations_create_clients_on_the_calling_thread(
+    mock_get_aws_client, mock_progress_event
+):
+    """Only the Cloud Control calls run on worker threads, never client creation."""
+    callers = []
+    call_threads = []
+    mock_client = MagicMock()
+    for method in ('create_resource', 'update_resource', 'delete_resource'):
+        getattr(mock_client, method).side_effect = lambda **kwargs: call_threads.append(
+            threading.get_ident()
+        ) or {'ProgressEvent': {}}
+    mock_client.get_resource.side_effect = lambda **kwargs: call_threads.append(
+        threading.get_ident()
+    ) or {'ResourceDescription': {'Properties': '{}'}}
+    mock_client.get_resource_request_status.side_effect = lambda **kwargs: call_threads.append(
+        threading.get_ident()
+    ) or {'ProgressEvent': {}}
+    mock_client.get_paginator.return_value.paginate.side_effect = lambda **kwargs: call_threads.append(
+        threading.get_ident()
+    ) or []
+    mock_get_aws_client.side_effect = lambda *args: callers.append(threading.get_ident()) or mock_client
+
+    await asyncio.gather(
+        ResourceOperations.list_resources_async('AWS::S3::Bucket', 'us-east-1'),
+        ResourceOperations.get_resource_async('AWS::S3::Bucket', 'b', 'us-east-1'),
+        ResourceOperations.get_resource_request_status_async('token', 'us-east-1'),
+        ResourceOperations.create_resource_async('AWS::S3::Bucket', {}, 'us-east-1'),
+        ResourceOperations.update_resource_async(
+            'AWS::S3::Bucket', 'b', [{'op': 'remove', 'path': '/Tags'}], 'us-east-1'
+        ),
+        ResourceOperations.delete_resource_async('AWS::S3::Bucket', 'b', 'us-east-1'),
+    )
+
+    assert callers == [threading.get_ident()] * 6
+    assert len(call_threads) == 6
+    assert threading.get_ident() not in call_threads
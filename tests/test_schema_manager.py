@@ -16,7 +16,7 @@
 import pytest
 import random
 import string
-from awslabs.cfn_mcp_server.schema_manager import schema_manager
+from awslabs.cfn_mcp_server.schema_manager import SchemaManager
 from unittest.mock import MagicMock, patch
 
 
@@ -25,7 +25,7 @@ class TestSchemaManager:
     """Tests on the schema_manager module."""
 
     @patch('awslabs.cfn_mcp_server.schema_manager.get_aws_client')
-    async def test_download_schema(self, mock_get_aws_client):
+    async def test_download_schema(self, mock_get_aws_client, tmp_path):
         """Testing getting a schema from download."""
         # Setup the mock
         type_final = ''.join(
@@ -39,13 +39,13 @@ class TestSchemaManager:
         mock_cfn_client = MagicMock(describe_type=MagicMock(return_value=response))
         mock_get_aws_client.return_value = mock_cfn_client
 
-        sm = schema_manager()
+        sm = SchemaManager(cache_dir=tmp_path)
 
         result = await sm.get_schema(type_name)
         assert result['properties'] == {}
 
     @patch('awslabs.cfn_mcp_server.schema_manager.get_aws_client')
-    async def test_load_schema(self, mock_get_aws_client):
+    async def test_load_schema(self, mock_get_aws_client, tmp_path):
         """Testing testing a schema that was already in the registry."""
         # Setup the mock
         type_final = ''.join(
@@ -59,8 +59,34 @@ class TestSchemaManager:
         mock_cfn_client = MagicMock(describe_type=MagicMock(return_value=response))
         mock_get_aws_client.return_value = mock_cfn_client
 
-        sm = schema_manager()
+        sm = SchemaManager(cache_dir=tmp_path)
 
         result1 = await sm.get_schema(type_name)
         result2 = await sm.get_schema(type_name)
         assert result1 == result2
+
+    @patch('awslabs.cfn_mcp_server.schema_manager.get_aws_client')
+    async def test_downloaded_schema_is_reused(self, mock_get_aws_client, tmp_path):
+        """Testing a downloaded schema is served from the registry afterwards."""
+        type_name = 'AWS::Fake::' + ''.join(
+            random.choice(string.ascii_uppercase + string.digits) for _ in range(5)
+        )
+        response = {'Schema': '{"properties": {}}'}
+        mock_cfn_client = MagicMock(describe_type=MagicMock(return_value=response))
+        mock_get_aws_client.return_value = mock_cfn_client
+
+        sm = SchemaManager(cache_dir=tmp_path)
+        result1 = await sm.get_schema(type_name)
+        result2 = await sm.get_schema(type_name)
+
+        assert result1 is result2
+        mock_cfn_client.describe_type.assert_called_once()
+
+    async def test_cached_schemas_load_without_writing_to_stdout(self, tmp_path, capsys):
+        """Testing schemas on disk are loaded without printing to the stdio transport."""
+        (tmp_path / 'AWS_Fake_Cached.json').write_text('{"typeName": "AWS::Fake::Cached"}')
+
+        sm = SchemaManager(cache_dir=tmp_path)
+
+        assert 'AWS::Fake::Cached' in sm.schema_registry
+        assert capsys.readouterr().out == ''